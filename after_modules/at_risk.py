@@ -0,0 +1,209 @@
+"""
+At-Risk Module
+
+Who needs a check-in from the guidance counselor? Ask once, get the list.
+
+Finding students with a low GPA, spotty attendance or a growing
+disciplinary record used to mean looking at every single student. The
+at-risk index keeps one small set per warning sign instead and only
+re-checks a student when their GPA, attendance or disciplinary record
+actually changes. Reading the list costs the same whether the district
+has 500 students or 500,000.
+
+Listeners hear about it when a student lands on the list or gets off it,
+so a counselor dashboard can react right away.
+
+Classes:
+- AtRiskIndex: Live index of students who crossed a warning threshold
+"""
+
+from grade_calculator import add_gpa_listener, remove_gpa_listener
+from student_utils import add_field_listener, remove_field_listener
+
+# Default warning thresholds
+GPA_RISK_THRESHOLD = 70            # GPA below this (0 means "no grades yet" and doesn't count)
+ATTENDANCE_RISK_THRESHOLD = 80     # Attendance percentage below this
+DISCIPLINARY_RISK_THRESHOLD = 3    # This many disciplinary actions or more
+
+# Which student field each warning sign depends on
+_REASON_FIELDS = {
+    "low_gpa": "gpa",
+    "low_attendance": "attendance",
+    "disciplinary": "disciplinary_actions"
+}
+
+
+class AtRiskIndex:
+    """
+    Students who crossed at least one warning threshold, kept up to date.
+
+    One set per reason ("low_gpa", "low_attendance", "disciplinary"). Once
+    attached, GPA changes (calculate_gpa, record_grade...), attendance and
+    discipline updates from student_utils, and students joining or leaving
+    a StudentRegistry each re-check just the one student involved.
+
+    Listeners get called as listener(event, student, reasons), where event
+    is "entered" (first warning sign) or "left" (last one cleared) and
+    reasons is the set of warning signs the student has now.
+    """
+
+    def __init__(self, students_list=(), gpa_below=GPA_RISK_THRESHOLD,
+                 attendance_below=ATTENDANCE_RISK_THRESHOLD,
+                 disciplinary_at_least=DISCIPLINARY_RISK_THRESHOLD):
+        self.students_list = students_list
+        self.gpa_below = gpa_below
+        self.attendance_below = attendance_below
+        self.disciplinary_at_least = disciplinary_at_least
+
+        # Reason -> {id(student): student}; dicts keep the order students landed in
+        self.by_reason = {reason: {} for reason in _REASON_FIELDS}
+        self._reasons = {}  # id(student) -> set of reasons, only for at-risk students
+        self._members = set()
+        self._listeners = []
+
+        for student in students_list:
+            self._add_student(student)
+
+    def _matches(self, reason, value):
+        """Whether a field value counts as a warning sign (private helper)."""
+        if reason == "low_gpa":
+            return 0 < value < self.gpa_below
+        if reason == "low_attendance":
+            return value < self.attendance_below
+        return value >= self.disciplinary_at_least
+
+    def _update(self, student, reason, value):
+        """Re-check one warning sign for one student, firing events if needed (private helper)."""
+        key = id(student)
+        members = self.by_reason[reason]
+        if self._matches(reason, value) == (key in members):
+            return
+
+        reasons = self._reasons.get(key)
+        if key in members:
+            del members[key]
+            reasons.discard(reason)
+            if not reasons:
+                del self._reasons[key]
+                self._notify("left", student, set())
+        else:
+            members[key] = student
+            if reasons is None:
+                reasons = self._reasons[key] = {reason}
+                self._notify("entered", student, set(reasons))
+            else:
+                reasons.add(reason)
+
+    def _add_student(self, student):
+        """Start tracking a student (private helper)."""
+        self._members.add(id(student))
+        for reason, field in _REASON_FIELDS.items():
+            self._update(student, reason, student[field])
+
+    def _remove_student(self, student):
+        """Stop tracking a student, dropping them from every list (private helper)."""
+        key = id(student)
+        self._members.discard(key)
+        if self._reasons.pop(key, None) is not None:
+            for members in self.by_reason.values():
+                members.pop(key, None)
+            self._notify("left", student, set())
+
+    def _notify(self, event, student, reasons):
+        """Tell every listener about a student entering or leaving (private helper)."""
+        for listener in self._listeners:
+            listener(event, student, reasons)
+
+    def add_listener(self, listener):
+        """
+        Register a function to call when a student enters or leaves the at-risk list.
+
+        Args:
+            listener (function): Called as listener(event, student, reasons)
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Stop calling a previously registered listener.
+
+        Args:
+            listener (function): The listener to remove
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def on_gpa_change(self, student, old_gpa, new_gpa):
+        """GPA listener - re-check the GPA warning sign."""
+        if id(student) in self._members:
+            self._update(student, "low_gpa", new_gpa)
+
+    def on_field_change(self, student, field, old_value, new_value):
+        """Attendance/discipline listener - re-check that warning sign."""
+        if id(student) in self._members:
+            if field == "attendance":
+                self._update(student, "low_attendance", new_value)
+            elif field == "disciplinary_actions":
+                self._update(student, "disciplinary", new_value)
+
+    def on_roster_change(self, event, student):
+        """StudentRegistry listener - a student joined or left."""
+        if event == "added":
+            self._add_student(student)
+        elif event == "removed":
+            self._remove_student(student)
+
+    def attach(self):
+        """Start listening for changes. Returns self so you can chain it."""
+        add_gpa_listener(self.on_gpa_change)
+        add_field_listener(self.on_field_change)
+        if hasattr(self.students_list, "add_listener"):
+            self.students_list.add_listener(self.on_roster_change)
+        return self
+
+    def detach(self):
+        """Stop listening for changes."""
+        remove_gpa_listener(self.on_gpa_change)
+        remove_field_listener(self.on_field_change)
+        if hasattr(self.students_list, "remove_listener"):
+            self.students_list.remove_listener(self.on_roster_change)
+
+    def __len__(self):
+        return len(self._reasons)
+
+    def __contains__(self, student):
+        return id(student) in self._reasons
+
+    def at_risk(self, reason=None):
+        """
+        The students on the at-risk list.
+
+        Args:
+            reason (str): Only this warning sign ("low_gpa", "low_attendance"
+                or "disciplinary"), or None for anyone with at least one
+
+        Returns:
+            list: Student dictionaries
+        """
+        if reason is not None:
+            return list(self.by_reason[reason].values())
+        seen = set()
+        students = []
+        for members in self.by_reason.values():
+            for key, student in members.items():
+                if key not in seen:
+                    seen.add(key)
+                    students.append(student)
+        return students
+
+    def reasons(self, student):
+        """
+        Why a student is on the list.
+
+        Args:
+            student (dict): The student
+
+        Returns:
+            set: Their warning signs (empty if they're doing fine)
+        """
+        return set(self._reasons.get(id(student), ()))
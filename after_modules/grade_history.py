@@ -0,0 +1,269 @@
+"""
+Grade History Module
+
+Because "how is this kid doing compared to last year?" deserves an answer.
+
+The roster only knows each student's GPA *right now*. This module takes a
+snapshot at the end of every semester: each student's GPA and category
+averages, rounded to the hundredth of a point and stored as small
+integers. After the first semester only the change since the student's
+previous snapshot is kept (delta encoding), and changes that small fit in
+two bytes each. Ten semesters of a 100,000-student school fit in a few
+megabytes, with no old rosters hanging around.
+
+Class-wide averages are worked out once when the snapshot is taken, so
+semester-over-semester comparisons don't have to touch any student at all.
+
+Classes:
+- SemesterHistory: Compact per-semester GPA and category average snapshots
+"""
+
+from array import array
+
+from grade_store import DEFAULT_CATEGORIES
+
+# Values are stored in hundredths of a point
+SCALE = 100
+
+# "Wasn't enrolled that semester" marker, one per array type. Deltas start
+# out as two-byte "h" arrays and move to four-byte "i" if one won't fit.
+_MISSING = {"h": -2 ** 15, "i": -2 ** 31}
+
+
+def _fixed_point(value):
+    """A grade or GPA as whole hundredths of a point (private helper function)."""
+    return int(round(value * SCALE))
+
+
+class SemesterHistory:
+    """
+    End-of-semester snapshots of every student's GPA and category averages.
+
+    Each student gets one row: the semester they first showed up in, plus
+    an array of deltas with one entry per metric per semester. The first
+    semester's entries are the actual values; every later entry is the
+    change since the student's previous snapshot. Semesters a student
+    missed (transferred out and came back, say) hold a marker instead.
+    """
+
+    def __init__(self, categories=DEFAULT_CATEGORIES):
+        self.metrics = ("gpa",) + tuple(categories)
+        self.semesters = []
+        self.class_summaries = []  # One dict per semester, see record_semester()
+        self._rows = {}  # student id -> [first semester index, array of deltas]
+        self._last = {}  # student id -> latest values (hundredths), for the next delta
+
+    def __len__(self):
+        return len(self.semesters)
+
+    def _values(self, student):
+        """A student's current metrics in hundredths of a point (private helper)."""
+        values = [_fixed_point(student["gpa"])]
+        for category in self.metrics[1:]:
+            grades = student["grades"].get(category)
+            values.append(_fixed_point(sum(grades) / len(grades)) if grades else 0)
+        return values
+
+    def _append(self, row, entries):
+        """Add one semester's entries to a row, widening it if needed (private helper)."""
+        deltas = row[1]
+        if deltas.typecode == "h" and any(not -2 ** 15 < entry < 2 ** 15 for entry in entries):
+            old_missing, new_missing = _MISSING["h"], _MISSING["i"]
+            deltas = row[1] = array("i", (new_missing if entry == old_missing else entry for entry in deltas))
+        deltas.extend(entries)
+
+    def _mark_missing(self, row, semesters):
+        """Mark semesters a student wasn't enrolled for (private helper)."""
+        row[1].extend([_MISSING[row[1].typecode]] * (semesters * len(self.metrics)))
+
+    def record_semester(self, name, students_list):
+        """
+        Snapshot everyone's GPA and category averages at the end of a semester.
+
+        Args:
+            name (str): Semester name (e.g. "Fall 2024")
+            students_list (list): The roster as it stands right now
+
+        Returns:
+            dict: The class summary for this semester
+
+        Raises:
+            ValueError: If that semester was already recorded
+        """
+        if name in self.semesters:
+            raise ValueError(f"{name} is already in the history books")
+
+        index = len(self.semesters)
+        width = len(self.metrics)
+        totals = [0] * width
+        counts = [0] * width
+        cohort_totals = [0] * width
+        cohort_counts = [0] * width
+        seen = set()
+
+        for student in students_list:
+            student_id = student["id"]
+            if student_id in seen:
+                continue
+            seen.add(student_id)
+            values = self._values(student)
+            for position, value in enumerate(values):
+                if value:
+                    totals[position] += value
+                    counts[position] += 1
+
+            row = self._rows.get(student_id)
+            if row is None:
+                self._rows[student_id] = [index, array("h")]
+                self._append(self._rows[student_id], values)
+            else:
+                missed = index - row[0] - len(row[1]) // width
+                if missed:
+                    self._mark_missing(row, missed)
+                last = self._last[student_id]
+                entries = [value - previous for value, previous in zip(values, last)]
+                self._append(row, entries)
+                if not missed:
+                    # Back from last semester: counts toward "how did returning students change?"
+                    for position, value in enumerate(values):
+                        if value and last[position]:
+                            cohort_totals[position] += entries[position]
+                            cohort_counts[position] += 1
+            self._last[student_id] = tuple(values)
+
+        summary = {
+            "semester": name,
+            "students": len(seen),
+            "averages": {
+                metric: totals[position] / counts[position] / SCALE if counts[position] else None
+                for position, metric in enumerate(self.metrics)
+            },
+            "returning_changes": {
+                metric: cohort_totals[position] / cohort_counts[position] / SCALE if cohort_counts[position] else None
+                for position, metric in enumerate(self.metrics)
+            },
+            "returning_students": max(cohort_counts) if cohort_counts else 0
+        }
+        self.semesters.append(name)
+        self.class_summaries.append(summary)
+        return summary
+
+    def student_history(self, student_id):
+        """
+        Every recorded semester for one student.
+
+        Args:
+            student_id (int): The student's ID
+
+        Returns:
+            list: (semester name, {metric: value} or None if not enrolled) per semester
+        """
+        row = self._rows.get(student_id)
+        history = [(semester, None) for semester in self.semesters]
+        if row is None:
+            return history
+
+        first, deltas = row
+        width = len(self.metrics)
+        missing = _MISSING[deltas.typecode]
+        running = [0] * width
+        for offset in range(0, len(deltas), width):
+            entries = deltas[offset:offset + width]
+            if entries[0] == missing:
+                continue
+            running = [value + entry for value, entry in zip(running, entries)]
+            semester_index = first + offset // width
+            history[semester_index] = (
+                self.semesters[semester_index],
+                {metric: value / SCALE for metric, value in zip(self.metrics, running)}
+            )
+        return history
+
+    def trajectory(self, student_id, metric="gpa"):
+        """
+        One metric for one student across every recorded semester.
+
+        Args:
+            student_id (int): The student's ID
+            metric (str): "gpa" or a grade category
+
+        Returns:
+            list: (semester name, value or None if not enrolled) per semester
+        """
+        return [
+            (semester, values[metric] if values is not None else None)
+            for semester, values in self.student_history(student_id)
+        ]
+
+    def class_deltas(self, metric="gpa"):
+        """
+        Semester-over-semester changes for the whole class.
+
+        "change" compares the class averages; "returning_change" is the
+        average change for students who were there both semesters, which
+        isn't thrown off by who graduated or transferred in.
+
+        Args:
+            metric (str): "gpa" or a grade category
+
+        Returns:
+            list: One dict per semester after the first, with "semester",
+                "previous_semester", "average", "change", "returning_change"
+                and "returning_students"
+        """
+        deltas = []
+        for previous, current in zip(self.class_summaries, self.class_summaries[1:]):
+            before = previous["averages"][metric]
+            after = current["averages"][metric]
+            deltas.append({
+                "semester": current["semester"],
+                "previous_semester": previous["semester"],
+                "average": after,
+                "change": after - before if after is not None and before is not None else None,
+                "returning_change": current["returning_changes"][metric],
+                "returning_students": current["returning_students"]
+            })
+        return deltas
+
+    def to_dict(self):
+        """
+        The whole history as plain JSON-friendly data.
+
+        Returns:
+            dict: Everything from_dict() needs to rebuild it
+        """
+        return {
+            "metrics": list(self.metrics),
+            "semesters": list(self.semesters),
+            "class_summaries": self.class_summaries,
+            "students": {
+                str(student_id): [first, deltas.typecode, deltas.tolist()]
+                for student_id, (first, deltas) in self._rows.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a history saved with to_dict().
+
+        Args:
+            data (dict): Output of to_dict() (possibly via JSON)
+
+        Returns:
+            SemesterHistory: The rebuilt history
+        """
+        history = cls(data["metrics"][1:])
+        history.semesters = list(data["semesters"])
+        history.class_summaries = list(data["class_summaries"])
+        width = len(history.metrics)
+        for raw_id, (first, typecode, deltas) in data["students"].items():
+            student_id = int(raw_id) if raw_id.lstrip("-").isdigit() else raw_id
+            row = history._rows[student_id] = [first, array(typecode, deltas)]
+            running = [0] * width
+            missing = _MISSING[typecode]
+            for offset in range(0, len(deltas), width):
+                if deltas[offset] != missing:
+                    running = [value + entry for value, entry in zip(running, row[1][offset:offset + width])]
+            history._last[student_id] = tuple(running)
+        return history
@@ -0,0 +1,376 @@
+"""
+Grade Sketches Module
+
+Medians and percentiles without sorting the whole school every time.
+
+A "sketch" is a tiny summary of a big pile of numbers that still answers
+useful questions about it. Here we keep two kinds:
+- RunningStats: Welford's running mean and variance (count, mean, spread)
+- GradeHistogram: one counter per grade point from 0 to 100, which is
+  enough to answer "what's the median?" or "what's the 90th percentile?"
+  by walking ~100 counters instead of sorting thousands of students
+
+Both can be updated one value at a time, can "un-count" a value when it
+changes, and can be merged (grade 9's sketch + grade 10's sketch = both).
+
+Classes:
+- RunningStats: Mergeable running mean/variance (Welford's algorithm)
+- GradeHistogram: Mergeable fixed-bin histogram with percentile lookups
+- DistributionSketch: Both of the above, updated together
+- GpaDistributionTracker: Live GPA sketches for the class and each grade level
+- GradeDistributionTracker: Live sketches of every grade, per category
+"""
+
+import math
+
+from grade_calculator import add_gpa_listener, remove_gpa_listener
+from grade_calculator import add_grade_listener, remove_grade_listener
+
+
+class RunningStats:
+    """Count, mean and variance maintained one value at a time (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # Sum of squared differences from the mean
+
+    def add(self, value):
+        """Include one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def remove(self, value):
+        """Un-include a value that was added earlier (e.g. a GPA that just changed)."""
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        old_mean = self.mean
+        self.count -= 1
+        self.mean = (old_mean * (self.count + 1) - value) / self.count
+        self._m2 = max(0.0, self._m2 - (value - self.mean) * (value - old_mean))
+
+    def merge(self, other):
+        """Fold another RunningStats into this one (Chan's parallel formula)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        """Population variance (0 with fewer than two values)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def stddev(self):
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class GradeHistogram:
+    """
+    Counts of values in fixed one-point-wide bins from 0 to 100.
+
+    Anything below 0 lands in the first bin and anything 100 or above
+    (hello, extra credit) lands in the last one, so memory never grows.
+    Percentiles are interpolated inside a bin, so they're accurate to
+    within one grade point.
+    """
+
+    LOW = 0
+    HIGH = 100
+
+    def __init__(self):
+        self.bins = [0] * (self.HIGH - self.LOW + 1)
+        self.count = 0
+
+    def _bin(self, value):
+        """Which bin a value belongs in (private helper)."""
+        index = int(value) - self.LOW
+        if index < 0:
+            return 0
+        if index >= len(self.bins):
+            return len(self.bins) - 1
+        return index
+
+    def add(self, value):
+        """Count one value."""
+        self.bins[self._bin(value)] += 1
+        self.count += 1
+
+    def remove(self, value):
+        """Un-count a value that was added earlier."""
+        index = self._bin(value)
+        if self.bins[index] > 0:
+            self.bins[index] -= 1
+            self.count -= 1
+
+    def merge(self, other):
+        """Fold another histogram into this one."""
+        for index, value in enumerate(other.bins):
+            self.bins[index] += value
+        self.count += other.count
+
+    def percentile(self, p):
+        """
+        Estimate a percentile.
+
+        Walks at most 101 bins no matter how many values were counted.
+
+        Args:
+            p (float): Percentile from 0 to 100 (50 = median)
+
+        Returns:
+            float or None: The estimate, or None if nothing was counted
+        """
+        if self.count == 0:
+            return None
+        target = max(0.0, min(100.0, p)) / 100 * self.count
+        seen = 0
+        for index, in_bin in enumerate(self.bins):
+            if in_bin and seen + in_bin >= target:
+                fraction = (target - seen) / in_bin
+                return min(float(self.HIGH), self.LOW + index + fraction)
+            seen += in_bin
+        return float(self.HIGH)
+
+
+class DistributionSketch:
+    """Running stats plus a histogram, kept in sync."""
+
+    def __init__(self):
+        self.stats = RunningStats()
+        self.histogram = GradeHistogram()
+
+    @property
+    def count(self):
+        return self.stats.count
+
+    def add(self, value):
+        """Include one value."""
+        self.stats.add(value)
+        self.histogram.add(value)
+
+    def remove(self, value):
+        """Un-include a value that was added earlier."""
+        self.stats.remove(value)
+        self.histogram.remove(value)
+
+    def merge(self, other):
+        """Fold another sketch into this one."""
+        self.stats.merge(other.stats)
+        self.histogram.merge(other.histogram)
+
+    def percentile(self, p):
+        """Estimate a percentile (0-100). See GradeHistogram.percentile()."""
+        return self.histogram.percentile(p)
+
+    def summary(self):
+        """
+        The headline numbers.
+
+        Returns:
+            dict: count, mean, stddev, p10, p50 and p90
+        """
+        return {
+            "count": self.stats.count,
+            "mean": self.stats.mean,
+            "stddev": self.stats.stddev,
+            "p10": self.percentile(10),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+        }
+
+
+class GpaDistributionTracker:
+    """
+    Live GPA sketches for the whole class and for each grade level.
+
+    Once attached, it listens for GPA changes from calculate_gpa() and
+    record_grade(), un-counts the old GPA and counts the new one (only for
+    students on its roster). If the roster is a StudentRegistry, students
+    joining or leaving are counted or un-counted too. Like
+    calculate_class_statistics(), a GPA of 0 means "no grades yet" and
+    isn't counted.
+    """
+
+    def __init__(self, students_list=()):
+        self.students_list = students_list
+        self.overall = DistributionSketch()
+        self.by_grade_level = {}
+        self._members = set()
+        for student in students_list:
+            self.add_student(student)
+
+    def _count(self, student, gpa):
+        """Add one GPA to the class and grade-level sketches (private helper)."""
+        if gpa > 0:
+            self.overall.add(gpa)
+            level = self.by_grade_level.get(student["grade"])
+            if level is None:
+                level = self.by_grade_level[student["grade"]] = DistributionSketch()
+            level.add(gpa)
+
+    def _uncount(self, student, gpa):
+        """Remove one GPA from the class and grade-level sketches (private helper)."""
+        if gpa > 0:
+            self.overall.remove(gpa)
+            level = self.by_grade_level.get(student["grade"])
+            if level is not None:
+                level.remove(gpa)
+
+    def on_gpa_change(self, student, old_gpa, new_gpa):
+        """GPA listener - keeps the sketches in sync with the roster."""
+        if id(student) in self._members:
+            self._uncount(student, old_gpa)
+            self._count(student, new_gpa)
+
+    def add_student(self, student):
+        """Count a student who was added to the roster after the tracker was built."""
+        self._members.add(id(student))
+        self._count(student, student["gpa"])
+
+    def remove_student(self, student):
+        """Un-count a student who left the roster."""
+        if id(student) in self._members:
+            self._members.discard(id(student))
+            self._uncount(student, student["gpa"])
+
+    def on_roster_change(self, event, student):
+        """StudentRegistry listener - a student joined or left."""
+        if event == "added":
+            self.add_student(student)
+        elif event == "removed":
+            self.remove_student(student)
+
+    def attach(self):
+        """Start listening for GPA (and roster) changes. Returns self so you can chain it."""
+        add_gpa_listener(self.on_gpa_change)
+        if hasattr(self.students_list, "add_listener"):
+            self.students_list.add_listener(self.on_roster_change)
+        return self
+
+    def detach(self):
+        """Stop listening for GPA (and roster) changes."""
+        remove_gpa_listener(self.on_gpa_change)
+        if hasattr(self.students_list, "remove_listener"):
+            self.students_list.remove_listener(self.on_roster_change)
+
+    def sketch(self, grade_level=None):
+        """
+        The sketch for the whole class, or for one grade level.
+
+        Args:
+            grade_level (int): Grade level, or None for the whole class
+
+        Returns:
+            DistributionSketch: The (possibly empty) sketch
+        """
+        if grade_level is None:
+            return self.overall
+        return self.by_grade_level.get(grade_level) or DistributionSketch()
+
+    def percentile(self, p, grade_level=None):
+        """
+        Estimate a GPA percentile for the class or one grade level.
+
+        Args:
+            p (float): Percentile from 0 to 100
+            grade_level (int): Grade level, or None for the whole class
+
+        Returns:
+            float or None: The estimate, or None if there are no GPAs yet
+        """
+        return self.sketch(grade_level).percentile(p)
+
+
+class GradeDistributionTracker:
+    """
+    Live sketches of every individual grade, one per grade category.
+
+    Once attached, every grade added through record_grade() (and so
+    add_grade()) or import_grades() for a student on its roster gets
+    counted. If the roster is a StudentRegistry, students joining or
+    leaving bring their grades with them.
+    """
+
+    def __init__(self, students_list=()):
+        self.students_list = students_list
+        self.by_category = {}
+        self._members = set()
+        for student in students_list:
+            self.add_student(student)
+
+    def _sketch_for(self, category):
+        """The sketch for a category, created on first use (private helper)."""
+        sketch = self.by_category.get(category)
+        if sketch is None:
+            sketch = self.by_category[category] = DistributionSketch()
+        return sketch
+
+    def on_grade(self, student, category, grade):
+        """Grade listener - counts one new grade."""
+        if id(student) in self._members:
+            self._sketch_for(category).add(grade)
+
+    def add_student(self, student):
+        """Count every grade of a student who joined the roster."""
+        self._members.add(id(student))
+        for category, grades in student["grades"].items():
+            sketch = self._sketch_for(category)
+            for grade in grades:
+                sketch.add(grade)
+
+    def remove_student(self, student):
+        """Un-count every grade of a student who left the roster."""
+        if id(student) in self._members:
+            self._members.discard(id(student))
+            for category, grades in student["grades"].items():
+                sketch = self._sketch_for(category)
+                for grade in grades:
+                    sketch.remove(grade)
+
+    def on_roster_change(self, event, student):
+        """StudentRegistry listener - a student joined or left."""
+        if event == "added":
+            self.add_student(student)
+        elif event == "removed":
+            self.remove_student(student)
+
+    def attach(self):
+        """Start listening for new grades (and roster changes). Returns self so you can chain it."""
+        add_grade_listener(self.on_grade)
+        if hasattr(self.students_list, "add_listener"):
+            self.students_list.add_listener(self.on_roster_change)
+        return self
+
+    def detach(self):
+        """Stop listening for new grades (and roster changes)."""
+        remove_grade_listener(self.on_grade)
+        if hasattr(self.students_list, "remove_listener"):
+            self.students_list.remove_listener(self.on_roster_change)
+
+    def sketch(self, category=None):
+        """
+        The sketch for one category, or every category merged together.
+
+        Args:
+            category (str): Grade category, or None for all of them
+
+        Returns:
+            DistributionSketch: The (possibly empty) sketch
+        """
+        if category is not None:
+            return self.by_category.get(category) or DistributionSketch()
+        merged = DistributionSketch()
+        for sketch in self.by_category.values():
+            merged.merge(sketch)
+        return merged
@@ -0,0 +1,203 @@
+"""
+Grade Store Module
+
+Column-based grade storage for crunching numbers across a whole class.
+
+Instead of every student owning four little lists of Python numbers, the
+store keeps ONE packed array('d') per grade category for the entire class,
+plus an offsets array that says where each student's grades start and end.
+Packed doubles take 8 bytes each instead of ~32 for a Python float in a
+list, and class-wide math becomes a single sweep over contiguous memory.
+
+If NumPy is installed it gets used for the sweeps; otherwise plain Python
+(itertools.accumulate over the arrays) does the job just fine.
+
+Classes:
+- GradeColumns: Class-wide columnar grade storage with vectorized averages and GPAs
+  (recalculate_all_gpas() workers pack their slice of the roster into one)
+"""
+
+import itertools
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - the pure Python path works everywhere
+    np = None
+
+DEFAULT_CATEGORIES = ("homework", "tests", "participation", "projects")
+
+
+class GradeColumns:
+    """
+    Every student's grades packed into one column per category.
+
+    For category c, student row i's grades live in
+    values[c][offsets[c][i]:offsets[c][i + 1]]. Rows are added in order,
+    so this is built for snapshots and reports - rebuild it with
+    from_students() after grades change.
+    """
+
+    def __init__(self, categories=DEFAULT_CATEGORIES):
+        self.categories = tuple(categories)
+        self.student_ids = array("q")
+        self.values = {category: array("d") for category in self.categories}
+        self.offsets = {category: array("q", [0]) for category in self.categories}
+        self._prefix_sums = None
+
+    @classmethod
+    def from_students(cls, students_list, categories=None):
+        """
+        Pack a whole roster's grades into columns.
+
+        Args:
+            students_list (list): List of student dictionaries
+            categories (iterable): Grade categories to store (defaults to the usual four)
+
+        Returns:
+            GradeColumns: The packed grade store
+        """
+        store = cls(categories or DEFAULT_CATEGORIES)
+        for student in students_list:
+            store.add_student(student)
+        return store
+
+    def __len__(self):
+        return len(self.student_ids)
+
+    def add_student(self, student):
+        """
+        Append one student's grades as a new row.
+
+        Args:
+            student (dict): Student dictionary
+
+        Returns:
+            int: The row number the student was stored at
+        """
+        row = len(self.student_ids)
+        self.student_ids.append(student["id"])
+        for category in self.categories:
+            column = self.values[category]
+            column.extend(student["grades"].get(category, ()))
+            self.offsets[category].append(len(column))
+        self._prefix_sums = None
+        return row
+
+    def grades(self, row, category):
+        """
+        Get one student's grades in a category without copying them.
+
+        Args:
+            row (int): Student row number
+            category (str): Grade category
+
+        Returns:
+            memoryview: Read-only view of the student's grades
+        """
+        offsets = self.offsets[category]
+        view = memoryview(self.values[category]).toreadonly()
+        return view[offsets[row]:offsets[row + 1]]
+
+    def _sums(self, category):
+        """
+        Running totals for a column, so any row's sum is one subtraction (private helper).
+
+        Args:
+            category (str): Grade category
+
+        Returns:
+            array: prefix[k] = sum of the first k values in the column
+        """
+        if self._prefix_sums is None:
+            self._prefix_sums = {}
+        prefix = self._prefix_sums.get(category)
+        if prefix is None:
+            prefix = array("d", [0.0])
+            prefix.extend(itertools.accumulate(self.values[category]))
+            self._prefix_sums[category] = prefix
+        return prefix
+
+    def category_average(self, row, category):
+        """
+        Average of one student's grades in one category.
+
+        Args:
+            row (int): Student row number
+            category (str): Grade category
+
+        Returns:
+            float or None: The average, or None if there are no grades
+        """
+        offsets = self.offsets[category]
+        start, end = offsets[row], offsets[row + 1]
+        if start == end:
+            return None
+        prefix = self._sums(category)
+        return (prefix[end] - prefix[start]) / (end - start)
+
+    def class_category_averages(self):
+        """
+        Average of every grade in each category across the whole class.
+
+        Returns:
+            dict: Category -> class-wide average (0 if nobody has grades yet)
+        """
+        averages = {}
+        for category in self.categories:
+            column = self.values[category]
+            if np is not None and len(column):
+                averages[category] = float(np.frombuffer(column, dtype=np.float64).mean())
+            else:
+                averages[category] = sum(column) / len(column) if column else 0
+        return averages
+
+    def gpas(self, weights):
+        """
+        Calculate every student's GPA in one pass per category.
+
+        Uses the same rules as calculate_gpa(): categories without grades
+        don't count, and the remaining weights get rescaled.
+
+        Args:
+            weights (dict): Category -> weight (e.g. GRADE_WEIGHTS)
+
+        Returns:
+            array: array('d') of GPAs, one per row (0.0 when there are no grades)
+        """
+        if np is not None:
+            return self._gpas_numpy(weights)
+
+        count = len(self.student_ids)
+        points = [0.0] * count
+        total_weight = [0.0] * count
+        for category, weight in weights.items():
+            if category not in self.values:
+                continue
+            offsets = self.offsets[category]
+            prefix = self._sums(category)
+            for row in range(count):
+                start, end = offsets[row], offsets[row + 1]
+                if start != end:
+                    points[row] += (prefix[end] - prefix[start]) / (end - start) * weight
+                    total_weight[row] += weight
+        return array("d", (p / w if w > 0 else 0.0 for p, w in zip(points, total_weight)))
+
+    def _gpas_numpy(self, weights):
+        """Vectorized version of gpas() (private helper, needs NumPy)."""
+        count = len(self.student_ids)
+        points = np.zeros(count)
+        total_weight = np.zeros(count)
+        for category, weight in weights.items():
+            if category not in self.values:
+                continue
+            offsets = np.frombuffer(self.offsets[category], dtype=np.int64)
+            prefix = np.frombuffer(self._sums(category), dtype=np.float64)
+            counts = np.diff(offsets)
+            has_grades = counts > 0
+            sums = prefix[offsets[1:]] - prefix[offsets[:-1]]
+            averages = np.divide(sums, counts, out=np.zeros(count), where=has_grades)
+            points += averages * weight
+            total_weight += np.where(has_grades, weight, 0.0)
+        result = np.divide(points, total_weight, out=np.zeros(count), where=total_weight > 0)
+        return array("d", result.tobytes())
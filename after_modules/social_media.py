@@ -9,11 +9,112 @@ Functions:
 - display_recent_posts(): Show recent posts from the feed
 - get_trending_hashtags(): Get popular hashtags
 - analyze_student_social_activity(): Analyze a student's social media presence
+- publish_post(): Add a post to the feed and notify post listeners
 """
 
 import random
 import datetime
-from student_utils import find_student_by_name
+import itertools
+from student_utils import find_student_or_suggest
+from trending import HashtagCounter, WindowedHashtagCounter, TRENDING_WINDOWS
+from social_feed import resolve_posts
+
+# Random post templates that high schoolers might actually post
+GENERAL_POST_TEMPLATES = [
+    "Just survived another day of high school 🏫😴",
+    "When the teacher says 'this won't be on the test' but it's definitely on the test 📚😭",
+    "Cafeteria food hit different today... in a bad way 🤢",
+    "Group project partner just ghosted us 👻 Classic move!",
+    "3 hours of homework for 1 class? Make it make sense 📝😵",
+    "Friday feeling already and it's only Tuesday 📅😑",
+    "That moment when you realize you studied for the wrong test 📖🤡",
+    "Teacher: 'Any questions?' Me: *has 47 questions* Also me: *stays silent* 🤐",
+    "Why do they call it rush hour when nobody's moving? Oh wait, that's the lunch line 🍕⏰",
+    "Successfully avoided eye contact with teacher for entire class 👁️‍🗨️✅",
+    "Coffee is my personality now ☕️💀",
+    "When you finish an assignment 5 minutes before it's due 🏃‍♀️💨",
+    "Plot twist: I actually understood the math lesson today 🤯📐",
+    "Dress code violation for showing my ankles apparently 🙄👟",
+    "Fire drill during the only class I actually like 🔥😒",
+    "Found a dollar in my locker from last semester 💵✨",
+    "Forgot my lunch and now I'm photosynthesizing 🌱☀️",
+    "When the WiFi goes down and we all become cavemen 📡❌",
+    "Successfully parallel parked on the first try! 🚗🎯",
+    "Procrastination level: expert 🏆⏰"
+]
+
+GENERAL_HASHTAGS = [
+    "#highschoollife", "#studentproblems", "#sendhelp",
+    "#almostweekend", "#cafeteriafood", "#homework",
+    "#groupprojects", "#teacherproblems", "#schoolvibes",
+    "#stressed", "#coffee", "#procrastination", "#mood",
+    "#relatable", "#teenageproblems", "#schoolstruggles"
+]
+
+# Non-academic post templates
+CASUAL_POST_TEMPLATES = [
+    "Just had the most random dream 😴💭",
+    "Found the perfect song for this mood 🎵✨",
+    "Weekend plans: absolutely nothing and loving it 🛋️",
+    "When did adulting become so complicated? 😅",
+    "Random thought: why do we park in driveways and drive on parkways? 🤔",
+    "Current status: motivated for exactly 3 minutes ⏰",
+    "Life update: still figuring it out 🤷‍♀️",
+    "Grateful for small things today 🙏💕",
+    "Plot twist: I actually cleaned my room 🧹✨",
+    "Me vs. my responsibilities: ongoing battle ⚔️"
+]
+
+CASUAL_HASHTAGS = [
+    "#mood", "#random", "#life", "#thoughts", "#vibes",
+    "#weekend", "#blessed", "#grateful", "#real", "#honest"
+]
+
+# Functions to call whenever a post is published: listener(post, social_media_posts)
+_post_listeners = []
+
+
+def add_post_listener(listener):
+    """
+    Get notified whenever a post is published to a feed.
+    
+    Args:
+        listener (callable): Called as listener(post, social_media_posts)
+    """
+    _post_listeners.append(listener)
+
+
+def remove_post_listener(listener):
+    """
+    Stop notifying a post listener.
+    
+    Args:
+        listener (callable): A listener passed to add_post_listener()
+    """
+    if listener in _post_listeners:
+        _post_listeners.remove(listener)
+
+
+def publish_post(post, social_media_posts, student=None, field="posts"):
+    """
+    Add a post to the feed (and its id to the student's own posts), then tell everyone.
+    
+    Every post in the system goes through here, so anything that keeps
+    running totals (like live statistics) only has to listen in one place.
+    The feed holds the only copy of the post; the student just gets its id.
+    
+    Args:
+        post (dict): The post to publish (gets an "id": its position in the feed)
+        social_media_posts (SocialFeed or list): The feed to add it to
+        student (dict): Author whose post ids should get it too (optional)
+        field (str): Which of the student's id lists: "posts" or "posts_about_school"
+    """
+    post["id"] = len(social_media_posts)
+    social_media_posts.append(post)
+    if student:
+        student["social_media"][field].append(post["id"])
+    for listener in _post_listeners:
+        listener(post, social_media_posts)
 
 
 def generate_social_media_post(students_list, social_media_posts):
@@ -25,50 +126,20 @@ def generate_social_media_post(students_list, social_media_posts):
         social_media_posts (list): List to add the new post to
     """
     student_name = input("Student name for social media post: ")
-    student = find_student_by_name(students_list, student_name)
+    student = find_student_or_suggest(students_list, student_name)
     
     if not student:
         print("Student not found. Creating anonymous post instead!")
         student_name = "Anonymous Student"
         student = None
     
-    # Random post templates that high schoolers might actually post
-    posts = [
-        "Just survived another day of high school 🏫😴",
-        "When the teacher says 'this won't be on the test' but it's definitely on the test 📚😭",
-        "Cafeteria food hit different today... in a bad way 🤢",
-        "Group project partner just ghosted us 👻 Classic move!",
-        "3 hours of homework for 1 class? Make it make sense 📝😵",
-        "Friday feeling already and it's only Tuesday 📅😑",
-        "That moment when you realize you studied for the wrong test 📖🤡",
-        "Teacher: 'Any questions?' Me: *has 47 questions* Also me: *stays silent* 🤐",
-        "Why do they call it rush hour when nobody's moving? Oh wait, that's the lunch line 🍕⏰",
-        "Successfully avoided eye contact with teacher for entire class 👁️‍🗨️✅",
-        "Coffee is my personality now ☕️💀",
-        "When you finish an assignment 5 minutes before it's due 🏃‍♀️💨",
-        "Plot twist: I actually understood the math lesson today 🤯📐",
-        "Dress code violation for showing my ankles apparently 🙄👟",
-        "Fire drill during the only class I actually like 🔥😒",
-        "Found a dollar in my locker from last semester 💵✨",
-        "Forgot my lunch and now I'm photosynthesizing 🌱☀️",
-        "When the WiFi goes down and we all become cavemen 📡❌",
-        "Successfully parallel parked on the first try! 🚗🎯",
-        "Procrastination level: expert 🏆⏰"
-    ]
-    
-    post_content = random.choice(posts)
+    post_content = random.choice(GENERAL_POST_TEMPLATES)
     timestamp = datetime.datetime.now()
     likes = random.randint(10, 200)
     comments = random.randint(0, 50)
     
     # Generate relevant hashtags
-    hashtags = random.sample([
-        "#highschoollife", "#studentproblems", "#sendhelp", 
-        "#almostweekend", "#cafeteriafood", "#homework", 
-        "#groupprojects", "#teacherproblems", "#schoolvibes",
-        "#stressed", "#coffee", "#procrastination", "#mood",
-        "#relatable", "#teenageproblems", "#schoolstruggles"
-    ], random.randint(2, 5))
+    hashtags = random.sample(GENERAL_HASHTAGS, random.randint(2, 5))
     
     # Create the post
     post = {
@@ -80,11 +151,8 @@ def generate_social_media_post(students_list, social_media_posts):
         "hashtags": hashtags
     }
     
-    social_media_posts.append(post)
-    
-    # Add to student's personal posts if student exists
-    if student:
-        student["social_media"]["posts"].append(post)
+    # Add to the feed (and the student's personal posts if student exists)
+    publish_post(post, social_media_posts, student)
     
     # Display the new post
     print(f"\n📱 New post by {student_name}:")
@@ -97,8 +165,11 @@ def display_recent_posts(social_media_posts, count=5):
     """
     Display the most recent social media posts.
     
+    Walks backwards from the newest post, so the feed itself is never
+    copied or reordered (a SocialFeed or a plain list both work).
+    
     Args:
-        social_media_posts (list): List of all social media posts
+        social_media_posts (SocialFeed or list): All social media posts
         count (int): Number of recent posts to display
     """
     if not social_media_posts:
@@ -109,9 +180,8 @@ def display_recent_posts(social_media_posts, count=5):
     print(f"📱 RECENT SOCIAL MEDIA POSTS (Last {count})")
     print("=" * 45)
     
-    # Get the most recent posts
-    recent_posts = social_media_posts[-count:] if len(social_media_posts) >= count else social_media_posts
-    recent_posts.reverse()  # Show newest first
+    # Newest first, straight off the end of the feed
+    recent_posts = itertools.islice(reversed(social_media_posts), count)
     
     for i, post in enumerate(recent_posts, 1):
         # Parse timestamp for display
@@ -126,35 +196,47 @@ def display_recent_posts(social_media_posts, count=5):
             print(f"   {' '.join(post['hashtags'])}")
 
 
-def get_trending_hashtags(social_media_posts, top_n=5):
+def get_trending_hashtags(social_media_posts, top_n=5, window=None, now=None):
     """
     Get the most popular hashtags from recent posts.
     
+    A SocialFeed already keeps hashtag counts as posts come in, so this is
+    just a quick heap lookup. A plain list of posts gets counted from scratch.
+    Time windows end right now by default, so if the school went quiet for
+    a week, "last hour" is empty instead of stuck on the last burst of posts.
+    
     Args:
-        social_media_posts (list): List of all social media posts
+        social_media_posts (SocialFeed or list): All social media posts
         top_n (int): Number of top hashtags to return
+        window (str): "hour", "day" or "week" (None = all time)
+        now (datetime.datetime): End of the window (defaults to the current time)
         
     Returns:
         list: List of (hashtag, count) tuples
     """
-    hashtag_counts = {}
-    
-    for post in social_media_posts:
-        if post.get('hashtags'):
-            for hashtag in post['hashtags']:
-                hashtag_counts[hashtag] = hashtag_counts.get(hashtag, 0) + 1
-    
-    # Sort by count and return top N
-    trending = sorted(hashtag_counts.items(), key=lambda x: x[1], reverse=True)
-    return trending[:top_n]
+    if window is None:
+        counter = getattr(social_media_posts, "hashtags", None)
+        if counter is None:
+            counter = HashtagCounter(social_media_posts)
+        return counter.top(top_n)
+    
+    if window not in TRENDING_WINDOWS:
+        raise ValueError(f"Unknown trending window: {window}")
+    counters = getattr(social_media_posts, "windowed_hashtags", None)
+    if counters is not None:
+        counter = counters[window]
+    else:
+        counter = WindowedHashtagCounter(*TRENDING_WINDOWS[window], posts=social_media_posts)
+    return counter.top(top_n, now if now is not None else datetime.datetime.now())
 
 
-def analyze_student_social_activity(student):
+def analyze_student_social_activity(student, social_media_posts=None):
     """
     Analyze and display a student's social media activity.
     
     Args:
         student (dict): Student to analyze
+        social_media_posts (SocialFeed or list): Feed to look the student's posts up in
     """
     if not student:
         print("Student not found. Can't analyze ghost activity!")
@@ -200,12 +282,13 @@ def analyze_student_social_activity(student):
             print("   (Keeping school life private 🤫)")
     
     # Recent school posts
-    if social_data['posts_about_school']:
+    recent_school_posts = resolve_posts(social_data['posts_about_school'][-3:], social_media_posts)
+    if recent_school_posts:
         print(f"\n📱 Recent School Posts:")
-        for post in social_data['posts_about_school'][-3:]:
+        for post in recent_school_posts:
             timestamp = datetime.datetime.fromisoformat(post['timestamp'])
             time_str = timestamp.strftime("%m/%d")
-            print(f"   • {time_str}: {post['post']} ({post['likes']} likes)")
+            print(f"   • {time_str}: {post.get('content', post.get('post'))} ({post['likes']} likes)")
     else:
         print(f"\n📱 No school-related posts yet!")
         print("   (Keeping academics and social media separate - wise choice!)")
@@ -222,29 +305,12 @@ def generate_random_student_post(student, social_media_posts):
     Returns:
         dict: The created post
     """
-    # Non-academic post templates
-    casual_posts = [
-        "Just had the most random dream 😴💭",
-        "Found the perfect song for this mood 🎵✨",
-        "Weekend plans: absolutely nothing and loving it 🛋️",
-        "When did adulting become so complicated? 😅",
-        "Random thought: why do we park in driveways and drive on parkways? 🤔",
-        "Current status: motivated for exactly 3 minutes ⏰",
-        "Life update: still figuring it out 🤷‍♀️",
-        "Grateful for small things today 🙏💕",
-        "Plot twist: I actually cleaned my room 🧹✨",
-        "Me vs. my responsibilities: ongoing battle ⚔️"
-    ]
-    
-    post_content = random.choice(casual_posts)
+    post_content = random.choice(CASUAL_POST_TEMPLATES)
     timestamp = datetime.datetime.now()
     likes = random.randint(15, 100)
     comments = random.randint(2, 25)
     
-    hashtags = random.sample([
-        "#mood", "#random", "#life", "#thoughts", "#vibes",
-        "#weekend", "#blessed", "#grateful", "#real", "#honest"
-    ], random.randint(1, 3))
+    hashtags = random.sample(CASUAL_HASHTAGS, random.randint(1, 3))
     
     post = {
         "student": student["name"],
@@ -255,8 +321,7 @@ def generate_random_student_post(student, social_media_posts):
         "hashtags": hashtags
     }
     
-    social_media_posts.append(post)
-    student["social_media"]["posts"].append(post)
+    publish_post(post, social_media_posts, student)
     
     return post
 
@@ -288,9 +353,15 @@ def handle_social_media_menu(students_list, social_media_posts):
         elif choice == "2":
             display_recent_posts(social_media_posts)
         elif choice == "3":
-            trending = get_trending_hashtags(social_media_posts)
+            window = input("Trending over the last hour, day or week? (Enter for all time): ").strip().lower()
+            if window and window not in TRENDING_WINDOWS:
+                print("That's not a time window. Going with all time.")
+                window = ""
+            trending = get_trending_hashtags(social_media_posts, window=window or None,
+                                             now=datetime.datetime.now())
             if trending:
-                print(f"\n🔥 TRENDING HASHTAGS:")
+                label = f" (LAST {window.upper()})" if window else ""
+                print(f"\n🔥 TRENDING HASHTAGS{label}:")
                 for i, (hashtag, count) in enumerate(trending, 1):
                     print(f"   {i}. {hashtag} ({count} posts)")
             else:
@@ -298,8 +369,8 @@ def handle_social_media_menu(students_list, social_media_posts):
                 print("   (Create some posts to see what's popular!)")
         elif choice == "4":
             student_name = input("Student name to analyze: ")
-            student = find_student_by_name(students_list, student_name)
-            analyze_student_social_activity(student)
+            student = find_student_or_suggest(students_list, student_name)
+            analyze_student_social_activity(student, social_media_posts)
         elif choice == "5":
             break
         else:
@@ -15,6 +15,7 @@ Look how much cleaner this is compared to the nightmare version!
 """
 
 import json
+import math
 import sys
 import os
 
@@ -22,15 +23,30 @@ import os
 from student_utils import (
     add_student, 
     find_student_by_name, 
+    find_student_or_suggest,
     find_student_by_id,
     generate_student_report,
-    load_sample_students
+    load_sample_students,
+    update_attendance,
+    record_disciplinary_action,
+    StudentRegistry
 )
 from grade_calculator import (
     add_grade,
-    calculate_class_statistics,
-    get_grade_weights
+    print_class_statistics,
+    get_grade_weights,
+    recalculate_all_gpas,
+    clear_gpa_cache,
+    clear_grade_summary_cache
 )
+from student_record import compact_students, expand_students
+from report_writer import write_reports
+from live_statistics import LiveClassStatistics
+from leaderboard import GpaLeaderboard
+from grade_history import SemesterHistory
+from at_risk import AtRiskIndex
+from grade_sketches import GpaDistributionTracker, GradeDistributionTracker
+from social_feed import SocialFeed, link_student_posts, json_default
 from social_media import (
     generate_social_media_post,
     display_recent_posts,
@@ -38,9 +54,46 @@ from social_media import (
 )
 
 # Global application state (kept minimal!)
-students = []
-social_media_posts = []
+# StudentRegistry is still a list, it just remembers where everyone sits
+students = StudentRegistry()
+# Only the newest posts stay in memory; older ones move to a temp archive file.
+# load_data() creates it - never at import time, because worker processes
+# started with "spawn" import this module all over again.
+social_media_posts = None
 current_semester = "Fall 2024"
+# End-of-semester GPA snapshots, so last year's numbers aren't lost forever
+grade_history = SemesterHistory()
+# Running statistics and rankings that keep themselves up to date (see start_live_statistics)
+live_statistics = None
+leaderboard = None
+at_risk_index = None
+gpa_distribution = None
+grade_distribution = None
+
+
+def start_live_statistics():
+    """
+    (Re)build the live class statistics, GPA leaderboard, at-risk index and
+    GPA/grade percentile sketches for the current roster and feed. Needed at
+    startup and whenever load_data() swaps in new lists.
+    """
+    global live_statistics, leaderboard, at_risk_index, gpa_distribution, grade_distribution
+    
+    if live_statistics is not None:
+        live_statistics.detach()
+    live_statistics = LiveClassStatistics(students, social_media_posts).attach()
+    if leaderboard is not None:
+        leaderboard.detach()
+    leaderboard = GpaLeaderboard(students).attach()
+    if at_risk_index is not None:
+        at_risk_index.detach()
+    at_risk_index = AtRiskIndex(students).attach()
+    if gpa_distribution is not None:
+        gpa_distribution.detach()
+    gpa_distribution = GpaDistributionTracker(students).attach()
+    if grade_distribution is not None:
+        grade_distribution.detach()
+    grade_distribution = GradeDistributionTracker(students).attach()
 
 
 def save_data():
@@ -49,13 +102,18 @@ def save_data():
     Clean and simple!
     """
     try:
-        # Save students data
+        # Save students data (compact StudentRecords get turned back into dicts,
+        # and their posts are saved as ids - the posts themselves go in the feed file)
         with open('/tmp/students_data.json', 'w') as f:
-            json.dump(students, f, indent=2, default=str)
+            json.dump(expand_students(students), f, indent=2, default=json_default)
         
-        # Save social media posts
+        # Save social media posts (as compact rows - hashtags and authors become ids)
         with open('/tmp/social_media_posts.json', 'w') as f:
-            json.dump(social_media_posts, f, indent=2, default=str)
+            json.dump(social_media_posts.to_dict(), f, default=str)
+        
+        # Save the semester history (plus which semester we're in now)
+        with open('/tmp/grade_history.json', 'w') as f:
+            json.dump({"current_semester": current_semester, "history": grade_history.to_dict()}, f)
         
         print("✅ Data saved successfully to /tmp/ folder!")
         print("   (Look at that organized data storage!)")
@@ -65,24 +123,63 @@ def save_data():
         print("   (Even modular code can't fix file system issues!)")
 
 
+def replace_social_feed(feed):
+    """
+    Swap in a new social media feed, closing the old one (and its archive file).
+    
+    Args:
+        feed (SocialFeed): The new feed (None to just close the old one)
+    """
+    global social_media_posts
+    
+    if social_media_posts is not None:
+        social_media_posts.close()
+    social_media_posts = feed
+
+
 def load_data():
     """
     Load application data from JSON files if they exist.
     """
-    global students, social_media_posts
+    global students, grade_history, current_semester
     
     try:
         # Load students data
         if os.path.exists('/tmp/students_data.json'):
+            # Loaded students are kept as compact StudentRecords (slots + interned strings)
             with open('/tmp/students_data.json', 'r') as f:
-                students = json.load(f)
+                students = StudentRegistry(compact_students(json.load(f)))
+            # Memoized profile GPAs, running totals and summary views belong to the old
+            # roster (same IDs, different students - and they keep those students alive)
+            clear_gpa_cache()
+            clear_grade_summary_cache()
+            # Saved GPAs might be from old grade weights, so bring them up to date
+            recalculate_all_gpas(students, quiet=True)
             print("📚 Student data loaded from file!")
         
         # Load social media posts
         if os.path.exists('/tmp/social_media_posts.json'):
             with open('/tmp/social_media_posts.json', 'r') as f:
-                social_media_posts = json.load(f)
+                saved_posts = json.load(f)
+            if isinstance(saved_posts, dict):
+                replace_social_feed(SocialFeed.from_dict(saved_posts, archive_to_disk=True))
+            else:
+                # Older saves: a plain list of post dictionaries
+                replace_social_feed(SocialFeed(saved_posts, archive_to_disk=True))
             print("📱 Social media data loaded from file!")
+        elif social_media_posts is None:
+            replace_social_feed(SocialFeed(archive_to_disk=True))
+        
+        # Students point at feed posts by id (older saves had copies of every post)
+        link_student_posts(students, social_media_posts)
+        
+        # Load the semester history
+        if os.path.exists('/tmp/grade_history.json'):
+            with open('/tmp/grade_history.json', 'r') as f:
+                saved_history = json.load(f)
+            grade_history = SemesterHistory.from_dict(saved_history["history"])
+            current_semester = saved_history["current_semester"]
+            print(f"📜 {len(grade_history)} semesters of grade history loaded!")
             
         if students or social_media_posts:
             print("✅ Data loaded successfully!")
@@ -92,8 +189,13 @@ def load_data():
     except Exception as e:
         print(f"❌ Error loading data: {e}")
         print("   Starting with empty data...")
-        students = []
-        social_media_posts = []
+        students = StudentRegistry()
+        clear_gpa_cache()
+        clear_grade_summary_cache()
+        replace_social_feed(SocialFeed(archive_to_disk=True))
+        grade_history = SemesterHistory()
+    
+    start_live_statistics()
 
 
 def load_sample_data():
@@ -137,44 +239,241 @@ def handle_student_management():
         print("2. Find Student by Name")
         print("3. Generate Student Report")
         print("4. List All Students")
-        print("5. Back to Main Menu")
+        print("5. Export All Reports")
+        print("6. Update Attendance or Discipline")
+        print("7. At-Risk Students")
+        print("8. Back to Main Menu")
         
-        choice = input("\nEnter your choice (1-5): ")
+        choice = input("\nEnter your choice (1-8): ")
         
         if choice == "1":
             add_student(students)
             
         elif choice == "2":
             name = input("Enter student name: ")
-            student = find_student_by_name(students, name)
+            student = find_student_or_suggest(students, name)
             if student:
                 print(f"✅ Found: {student['name']} (ID: {student['id']}, Grade: {student['grade']})")
                 print(f"   GPA: {student['gpa']:.2f} | Attendance: {student['attendance']}%")
+                rank = leaderboard.rank(student)
+                if rank:
+                    print(f"   Class rank: #{rank} of {len(leaderboard)}")
             else:
                 print("❌ Student not found. Check the spelling or try a different name.")
                 
         elif choice == "3":
             name = input("Enter student name for report: ")
-            student = find_student_by_name(students, name)
-            generate_student_report(student)
+            student = find_student_or_suggest(students, name)
+            generate_student_report(student, social_media_posts)
             
         elif choice == "4":
             if students:
-                print(f"\n📋 ALL STUDENTS ({len(students)} total):")
+                print(f"\n📋 ALL STUDENTS ({len(students)} total, best GPA first):")
                 print("-" * 60)
+                for rank, student in enumerate(leaderboard.top(len(leaderboard)), 1):
+                    print(f"  #{rank} {student['name']} (Grade {student['grade']}) - GPA: {student['gpa']:.2f}")
                 for student in students:
-                    print(f"  {student['name']} (Grade {student['grade']}) - GPA: {student['gpa']:.2f}")
+                    if leaderboard.rank(student) is None:
+                        print(f"  -- {student['name']} (Grade {student['grade']}) - No grades yet")
             else:
                 print("\n📋 No students in the system yet!")
                 print("   Add some students to get started!")
                 
         elif choice == "5":
+            if students:
+                output_dir = input("Folder for reports (Enter for /tmp/student_reports): ")
+                write_reports(students, output_dir=output_dir or '/tmp/student_reports',
+                              social_media_posts=social_media_posts)
+            else:
+                print("\n📋 No students, no reports. Easiest grading day ever!")
+                
+        elif choice == "6":
+            update_student_record()
+            
+        elif choice == "7":
+            show_at_risk_students()
+            
+        elif choice == "8":
             break
             
         else:
             print("❌ Invalid choice. Try again!")
 
 
+def update_student_record():
+    """
+    Update a student's attendance or add to their disciplinary record.
+    """
+    name = input("Student name: ")
+    student = find_student_or_suggest(students, name)
+    if not student:
+        print("❌ Student not found. Can't write up someone who doesn't exist.")
+        return
+    
+    was_at_risk = student in at_risk_index
+    print(f"Attendance: {student['attendance']}% | Disciplinary actions: {student['disciplinary_actions']}")
+    raw_attendance = input("New attendance % (Enter to keep): ").strip()
+    if raw_attendance:
+        try:
+            attendance = float(raw_attendance)
+            if not math.isfinite(attendance):
+                raise ValueError(raw_attendance)
+            print(f"📅 Attendance set to {update_attendance(student, attendance)}%")
+        except (ValueError, OverflowError):
+            print("❌ That's not a percentage. Attendance unchanged.")
+    
+    raw_actions = input("Disciplinary actions to add (Enter for none): ").strip()
+    if raw_actions:
+        try:
+            total = record_disciplinary_action(student, int(raw_actions))
+            print(f"📋 Disciplinary actions now at {total}")
+        except ValueError:
+            print("❌ That's not a number. Record unchanged.")
+    
+    if student in at_risk_index and not was_at_risk:
+        print(f"⚠️ {student['name']} just landed on the at-risk list. Time for a check-in!")
+    elif was_at_risk and student not in at_risk_index:
+        print(f"🎉 {student['name']} is off the at-risk list. Nice turnaround!")
+
+
+def show_at_risk_students():
+    """
+    List students who crossed a warning threshold, and why.
+    """
+    flagged = at_risk_index.at_risk()
+    if not flagged:
+        print("\n✅ Nobody is at risk right now. Enjoy it while it lasts.")
+        return
+    
+    labels = {
+        "low_gpa": f"GPA under {at_risk_index.gpa_below}",
+        "low_attendance": f"attendance under {at_risk_index.attendance_below}%",
+        "disciplinary": f"{at_risk_index.disciplinary_at_least}+ disciplinary actions"
+    }
+    print(f"\n⚠️ AT-RISK STUDENTS ({len(flagged)} total):")
+    print("-" * 60)
+    for student in flagged:
+        reasons = ", ".join(labels[reason] for reason in sorted(at_risk_index.reasons(student)))
+        print(f"  {student['name']} (Grade {student['grade']}) - {reasons}")
+
+
+def show_percentiles():
+    """
+    Show the 10th, 50th and 90th percentile GPA and grade per category.
+    Straight from the live sketches - no sorting the whole school.
+    """
+    overall = gpa_distribution.sketch()
+    if overall.count:
+        print(f"\nGPA Percentiles (10th / median / 90th):")
+        levels = [(None, overall)] + sorted(gpa_distribution.by_grade_level.items())
+        for grade_level, sketch in levels:
+            if sketch.count:
+                summary = sketch.summary()
+                label = "Whole class" if grade_level is None else f"Grade {grade_level}"
+                print(f"  {label}: {summary['p10']:.1f} / {summary['p50']:.1f} / {summary['p90']:.1f}")
+    
+    categories = [(category, sketch) for category, sketch in grade_distribution.by_category.items() if sketch.count]
+    if categories:
+        print(f"\nGrade Percentiles by Category (10th / median / 90th):")
+        for category, sketch in categories:
+            summary = sketch.summary()
+            print(f"  {category.title()}: {summary['p10']:.1f} / {summary['p50']:.1f} / {summary['p90']:.1f}")
+
+
+def show_leaderboard():
+    """
+    Show the top and bottom 10 GPAs, for the whole class or one grade level.
+    """
+    raw_level = input("Grade level (9-12, Enter for whole class): ").strip()
+    grade_level = None
+    if raw_level:
+        try:
+            grade_level = int(raw_level)
+        except ValueError:
+            print("❌ That's not a grade level. Showing the whole class.")
+    
+    top = leaderboard.top(10, grade_level)
+    if not top:
+        print("\n🏆 Nobody there has grades yet. Everyone's tied for first!")
+        return
+    
+    title = f"GRADE {grade_level}" if grade_level is not None else "CLASS"
+    print(f"\n🏆 {title} LEADERBOARD - TOP {len(top)}:")
+    for rank, student in enumerate(top, 1):
+        print(f"  #{rank} {student['name']} - GPA: {student['gpa']:.2f}")
+    
+    bottom = leaderboard.bottom(10, grade_level)
+    ranked = len(leaderboard.by_grade_level.get(grade_level, ())) if grade_level is not None else len(leaderboard)
+    print(f"\n📉 COULD USE SOME TUTORING - BOTTOM {len(bottom)}:")
+    for offset, student in enumerate(bottom):
+        print(f"  #{ranked - offset} {student['name']} - GPA: {student['gpa']:.2f}")
+
+
+def close_semester():
+    """
+    Snapshot everyone's GPA for the history books and move on to the next semester.
+    """
+    global current_semester
+    
+    if not students:
+        print("\n📜 No students to remember. That was a quiet semester.")
+        return
+    
+    next_semester = input(f"Closing out {current_semester}. Name of the next semester: ").strip()
+    if not next_semester or next_semester == current_semester:
+        print("❌ The next semester needs a new name. Nothing was closed.")
+        return
+    
+    try:
+        summary = grade_history.record_semester(current_semester, students)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    average_gpa = summary["averages"]["gpa"]
+    print(f"\n📜 {current_semester} is in the history books: {summary['students']} students", end="")
+    print(f", average GPA {average_gpa:.2f}" if average_gpa is not None else "")
+    current_semester = next_semester
+    print(f"   Welcome to {current_semester}! Fresh start (the grades don't reset, sorry).")
+
+
+def show_gpa_trends():
+    """
+    Show how the class (or one student) has done semester over semester.
+    """
+    if not len(grade_history):
+        print("\n📈 No semesters recorded yet. Close out a semester first!")
+        return
+    
+    print(f"\n📈 CLASS GPA BY SEMESTER:")
+    first = grade_history.class_summaries[0]
+    if first["averages"]["gpa"] is not None:
+        print(f"  {first['semester']}: {first['averages']['gpa']:.2f}")
+    for delta in grade_history.class_deltas():
+        if delta["average"] is None:
+            print(f"  {delta['semester']}: no GPAs yet")
+            continue
+        line = f"  {delta['semester']}: {delta['average']:.2f}"
+        if delta["change"] is not None:
+            line += f" ({delta['change']:+.2f} vs {delta['previous_semester']}"
+            if delta["returning_change"] is not None:
+                line += f", returning students {delta['returning_change']:+.2f}"
+            line += ")"
+        print(line)
+    
+    name = input("\nStudent name for their trajectory (Enter to skip): ").strip()
+    if not name:
+        return
+    student = find_student_or_suggest(students, name)
+    if not student:
+        print("❌ Student not found. Their history remains a mystery.")
+        return
+    print(f"\n📈 {student['name']}'s GPA by semester:")
+    for semester, gpa in grade_history.trajectory(student["id"]):
+        print(f"  {semester}: {gpa:.2f}" if gpa is not None else f"  {semester}: not enrolled")
+    print(f"  {current_semester} (so far): {student['gpa']:.2f}")
+
+
 def handle_grade_management():
     """
     Handle the grade management submenu.
@@ -184,9 +483,12 @@ def handle_grade_management():
         print("1. Add Grade")
         print("2. View Grade Weights")
         print("3. Calculate Class Statistics")
-        print("4. Back to Main Menu")
+        print("4. GPA Leaderboard")
+        print("5. GPA Trends")
+        print("6. Close Out Semester")
+        print("7. Back to Main Menu")
         
-        choice = input("\nEnter your choice (1-4): ")
+        choice = input("\nEnter your choice (1-7): ")
         
         if choice == "1":
             add_grade(students, social_media_posts)
@@ -202,9 +504,18 @@ def handle_grade_management():
             print(f"  Total: {total_weight * 100}%")
             
         elif choice == "3":
-            calculate_class_statistics(students, social_media_posts, current_semester)
+            print_class_statistics(live_statistics.snapshot(), current_semester)
             
         elif choice == "4":
+            show_leaderboard()
+            
+        elif choice == "5":
+            show_gpa_trends()
+            
+        elif choice == "6":
+            close_semester()
+            
+        elif choice == "7":
             break
             
         else:
@@ -241,7 +552,8 @@ def main():
                 handle_social_media_menu(students, social_media_posts)
                 
             elif choice == "4":
-                calculate_class_statistics(students, social_media_posts, current_semester)
+                print_class_statistics(live_statistics.snapshot(), current_semester)
+                show_percentiles()
                 
             elif choice == "5":
                 save_data()
@@ -275,6 +587,9 @@ def main():
         except Exception as e:
             print(f"❌ An error occurred: {e}")
             print("But hey, at least the error is contained in a module! 🎭")
+    
+    # Done with the feed - this also cleans up its temp archive file
+    replace_social_feed(None)
 
 
 if __name__ == "__main__":
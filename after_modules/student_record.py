@@ -0,0 +1,241 @@
+"""
+Student Record Module
+
+A compact way to store students when you have a LOT of them.
+
+Every student dictionary carries around ~20 keys plus its own copy of the
+same handful of strings ("Mom (good luck reaching her)", "Skateboard", ...).
+Multiply that by a whole district and your laptop starts sounding like a
+jet engine. These classes use __slots__ (no per-object dictionary) and
+intern the repeated strings so every student shares one copy.
+
+They still act like the dictionaries the rest of the system expects, so
+student["grades"]["tests"].append(95) keeps working, and they convert back
+to the exact same dict/JSON shape whenever you need it. load_data()
+keeps every student it reads from a save file in this compact form.
+
+Classes:
+- SocialMediaProfile: Slotted version of student["social_media"]
+- StudentRecord: Slotted version of a whole student dictionary
+
+Functions:
+- compact_students(): Convert student dictionaries into StudentRecords
+- expand_students(): Convert StudentRecords back into plain dictionaries
+"""
+
+import sys
+from collections.abc import Mapping
+
+# Fields whose values come from a small vocabulary and repeat constantly
+INTERNED_FIELDS = (
+    "favorite_excuse",
+    "emergency_contact",
+    "dietary_restrictions",
+    "transportation",
+    "career_goals",
+)
+
+# List fields whose items also repeat constantly ("Math", "Coding Club", ...)
+INTERNED_LIST_FIELDS = ("subjects", "clubs")
+
+
+# Placeholder for "this key wasn't in the original dictionary"
+_MISSING = object()
+
+
+def _intern(value):
+    """Intern a string so identical values share memory (private helper function)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _SlottedMapping:
+    """
+    Dictionary-style access for slotted classes (private base class).
+
+    Subclasses list their known keys in FIELDS. Known keys that were never
+    set stay missing (not None), and any unexpected keys are kept in an
+    "extras" dictionary, so nothing gets lost or invented in the round trip.
+    """
+
+    FIELDS = ()
+    __slots__ = ("extras",)
+
+    def __init__(self, **fields):
+        extras = {}
+        for key in self.FIELDS:
+            setattr(self, key, _MISSING)
+        for key, value in fields.items():
+            if key in self.FIELDS:
+                setattr(self, key, value)
+            else:
+                extras[key] = value
+        self.extras = extras or None
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self.extras and key in self.extras:
+            return self.extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+
+    def __contains__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key) is not _MISSING
+        return bool(self.extras and key in self.extras)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def keys(self):
+        keys = [key for key in self.FIELDS if getattr(self, key) is not _MISSING]
+        if self.extras:
+            keys.extend(self.extras)
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def to_dict(self):
+        """
+        Convert back into the original dictionary shape (safe for json.dump).
+
+        Returns:
+            dict: Plain dictionary with the original keys
+        """
+        data = {}
+        for key, value in self.items():
+            if isinstance(value, _SlottedMapping):
+                value = value.to_dict()
+            data[key] = value
+        return data
+
+    def __reduce__(self):
+        # Pickle (for worker processes) as the plain dict, so missing keys stay missing
+        return (type(self).from_dict, (self.to_dict(),))
+
+
+# Anything that checks isinstance(value, Mapping) treats these like dicts
+Mapping.register(_SlottedMapping)
+
+
+class SocialMediaProfile(_SlottedMapping):
+    """A student's social media stats and posts, minus the dictionary overhead."""
+
+    FIELDS = ("posts", "followers", "following", "posts_about_school")
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a profile from a student["social_media"] dictionary.
+
+        Args:
+            data (dict): Social media dictionary
+
+        Returns:
+            SocialMediaProfile: The compact profile
+        """
+        return cls(**data)
+
+
+class StudentRecord(_SlottedMapping):
+    """
+    A whole student in a fraction of the memory of a dictionary.
+
+    Field order matches the dictionaries built by add_student(), so
+    to_dict() gives back exactly what went in (extra keys included).
+    Use to_dict() before handing a record to json.dump.
+    """
+
+    FIELDS = (
+        "id", "name", "grade", "email", "subjects", "grades", "gpa",
+        "attendance", "disciplinary_actions", "favorite_excuse", "social_media",
+        "emergency_contact", "dietary_restrictions", "transportation", "clubs",
+        "career_goals",
+    )
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a compact record from a student dictionary.
+
+        Categorical strings get interned, so 100,000 students who all take
+        the "Bus" share one "Bus" string instead of 100,000 copies.
+
+        Args:
+            data (dict): Student dictionary (as built by add_student or loaded from JSON)
+
+        Returns:
+            StudentRecord: The compact record
+        """
+        fields = dict(data)
+        for key in INTERNED_FIELDS:
+            if key in fields:
+                fields[key] = _intern(fields[key])
+        for key in INTERNED_LIST_FIELDS:
+            if isinstance(fields.get(key), list):
+                fields[key] = [_intern(item) for item in fields[key]]
+        if isinstance(fields.get("social_media"), dict):
+            fields["social_media"] = SocialMediaProfile.from_dict(fields["social_media"])
+        if isinstance(fields.get("grades"), dict):
+            fields["grades"] = {_intern(category): grades for category, grades in fields["grades"].items()}
+        return cls(**fields)
+
+    def __repr__(self):
+        return f"StudentRecord(id={self.id!r}, name={self.name!r})"
+
+
+def compact_students(students_list):
+    """
+    Convert a list of student dictionaries into compact StudentRecords.
+
+    Args:
+        students_list (list): Student dictionaries
+
+    Returns:
+        list: StudentRecord objects, same order
+    """
+    return [StudentRecord.from_dict(student) for student in students_list]
+
+
+def expand_students(records):
+    """
+    Convert StudentRecords back into plain dictionaries (e.g. before saving).
+
+    Args:
+        records (list): StudentRecord objects (plain dicts pass straight through)
+
+    Returns:
+        list: Student dictionaries, same order
+    """
+    return [record.to_dict() if isinstance(record, StudentRecord) else record for record in records]
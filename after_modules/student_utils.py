@@ -6,52 +6,328 @@ Look how clean and organized this is! Your future self will thank you.
 
 Functions:
 - add_student(): Add a new student to the system
+- create_student(): Build a new student dictionary
+- import_students(): Bulk-import students from CSV or JSONL files
+- allocate_student_id(): Get a student ID nobody else is using
 - find_student_by_id(): Find a student by their ID
 - find_student_by_name(): Find a student by their name
+- suggest_students(): Find likely matches for a partial or misspelled name
+- find_student_or_suggest(): Look up a student, offering suggestions on a miss
+- update_attendance(): Change a student's attendance percentage
+- record_disciplinary_action(): Add to a student's disciplinary record
+- add_field_listener(): Get notified about attendance and discipline changes
+- render_student_report(): Build a student report as a single string
 - generate_student_report(): Create a detailed student report
+
+Classes:
+- StudentRegistry: A student list with instant lookups by ID and name
 """
 
+import csv
+import json
 import random
 import datetime
+import math
+import re
+import time
+import unicodedata
+from array import array
+from student_search import NameSearchIndex
+from id_allocator import StudentIdAllocator
+from social_feed import resolve_posts
 
+# The stuff every student gets randomly assigned. Shared with anything else
+# that needs to invent students (bulk imports, sample data generators...)
+GRADE_LEVELS = [9, 10, 11, 12]
 
-def add_student(students_list):
+# Most students are angels. Most.
+DISCIPLINARY_ODDS = [0, 0, 0, 1, 2]
+
+FAVORITE_EXCUSES = [
+    "My internet was down",
+    "I forgot we had school today",
+    "My cat deleted my homework",
+    "I was abducted by aliens",
+    "Time is a social construct"
+]
+
+DIETARY_RESTRICTIONS = [
+    "None", "Vegetarian", "Allergic to vegetables", "Only eats pizza"
+]
+
+TRANSPORTATION_OPTIONS = [
+    "Bus", "Car", "Skateboard", "Pure willpower", "Teleportation"
+]
+
+CAREER_GOALS = [
+    "I have no idea",
+    "Internet famous",
+    "Professional gamer",
+    "Something with computers",
+    "Anything that pays well"
+]
+
+
+def _name_key(name):
     """
-    Add a new student to the system.
+    Normalize a name for case-insensitive lookups (private helper function).
     
     Args:
-        students_list (list): List of existing students
+        name (str): The name to normalize
         
     Returns:
-        dict: The newly created student dictionary
+        str: The casefolded name
     """
-    print("Adding a new student to our digital prison... I mean, system!")
+    return name.casefold()
+
+
+class StudentRegistry(list):
+    """
+    A list of students that also keeps hash indexes by ID and by name.
     
-    name = input("Student name (or nickname if they're too cool for real names): ")
-    if not name:
-        name = "Anonymous Troublemaker"
+    It behaves exactly like the plain list the rest of the system already
+    passes around (append, extend, loops, len, json.dump all still work),
+    but lookups no longer have to check every single student in the school.
+    Like having a seating chart instead of shouting names across the room.
     
-    # Generate random student ID because we're efficient like that
-    student_id = random.randint(10000, 99999)
+    If you change a student's name or ID by hand, call reindex() afterwards.
     
-    # Get grade level with error handling
+    It also owns the StudentIdAllocator, so new IDs never clash with anyone
+    already on the roster (including students loaded from a file).
+    """
+    
+    def __init__(self, students=()):
+        super().__init__()
+        self.id_allocator = StudentIdAllocator()
+        self._by_id = {}
+        self._by_name = {}
+        self._search_index = None
+        self._listeners = []
+        self.extend(students)
+    
+    def add_listener(self, listener):
+        """
+        Get notified whenever a student joins or leaves the roster.
+        
+        Args:
+            listener (callable): Called as listener("added" or "removed", student)
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """
+        Stop notifying a roster listener.
+        
+        Args:
+            listener (callable): A listener passed to add_listener()
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, event, students):
+        """Tell every listener about added or removed students (private helper)."""
+        for student in students:
+            for listener in self._listeners:
+                listener(event, student)
+    
+    def _index(self, student):
+        """Add one student to the lookup indexes (first one in wins, like a linear scan)."""
+        self._by_id.setdefault(student["id"], student)
+        self._by_name.setdefault(_name_key(student["name"]), student)
+        self.id_allocator.reserve(student["id"])
+        if self._search_index is not None:
+            self._search_index.add(student)
+    
+    def reindex(self):
+        """Rebuild the lookup indexes from scratch after out-of-band edits."""
+        self._by_id = {}
+        self._by_name = {}
+        # The search index gets rebuilt lazily the next time someone searches
+        self._search_index = None
+        for student in self:
+            self._index(student)
+    
+    def append(self, student):
+        super().append(student)
+        self._index(student)
+        if self._listeners:
+            self._notify("added", (student,))
+    
+    def extend(self, students):
+        for student in students:
+            self.append(student)
+    
+    def __iadd__(self, students):
+        self.extend(students)
+        return self
+    
+    # Anything that reorders or removes students can change who "wins" a
+    # lookup, so those rebuild the indexes. They're rare, so that's fine.
+    def insert(self, index, student):
+        super().insert(index, student)
+        self.reindex()
+        self._notify("added", (student,))
+    
+    def remove(self, student):
+        index = self.index(student)
+        removed = self[index]
+        super().__delitem__(index)
+        self.reindex()
+        self._notify("removed", (removed,))
+    
+    def pop(self, index=-1):
+        student = super().pop(index)
+        self.reindex()
+        self._notify("removed", (student,))
+        return student
+    
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self.reindex()
+        self._notify("removed", removed)
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            removed, added = self[index], list(value)
+            value = added
+        else:
+            removed, added = [self[index]], [value]
+        super().__setitem__(index, value)
+        self.reindex()
+        self._notify("removed", removed)
+        self._notify("added", added)
+    
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self.reindex()
+        self._notify("removed", removed)
+    
+    def get_by_id(self, student_id):
+        """
+        Find a student by ID in O(1).
+        
+        Args:
+            student_id (int): The student ID to find
+            
+        Returns:
+            dict or None: Student dictionary if found, None otherwise
+        """
+        return self._by_id.get(student_id)
+    
+    def get_by_name(self, name):
+        """
+        Find a student by name (case-insensitive) in O(1).
+        
+        Args:
+            name (str): The student name to find
+            
+        Returns:
+            dict or None: Student dictionary if found, None otherwise
+        """
+        return self._by_name.get(_name_key(name))
+    
+    def search(self, query, limit=5):
+        """
+        Find ranked candidates for a partial or misspelled name.
+        
+        The search index is only built the first time somebody needs it,
+        then kept up to date as students are added.
+        
+        Args:
+            query (str): Full, partial or misspelled name
+            limit (int): Maximum number of candidates
+            
+        Returns:
+            list: Candidate student dictionaries, best match first
+        """
+        if self._search_index is None:
+            self._search_index = NameSearchIndex(self)
+        return self._search_index.search(query, limit)
+
+
+def allocate_student_id(students_list):
+    """
+    Get a student ID that nobody on the roster is using yet.
+    
+    Args:
+        students_list (list): List of existing students
+        
+    Returns:
+        int: A unique student ID
+    """
+    if isinstance(students_list, StudentRegistry):
+        return students_list.id_allocator.allocate()
+    
+    # Plain lists don't remember anything, so figure it out the slow way
+    return StudentIdAllocator.from_students(students_list).allocate()
+
+
+def parse_grade_level(raw_grade):
+    """
+    Turn whatever somebody typed into a grade level.
+    
+    Args:
+        raw_grade (str or int): The grade level as entered
+        
+    Returns:
+        tuple: (grade, problem) where problem is None, "out_of_range" or "invalid".
+            Out-of-range grades are kept; invalid ones get a random grade.
+    """
     try:
-        grade = int(input("Grade level (9-12, or just guess): "))
-        if grade < 9 or grade > 12:
-            print("That's not a high school grade, but sure, let's go with it.")
-    except ValueError:
-        grade = random.choice([9, 10, 11, 12])
-        print(f"Invalid input. I'll just say they're in grade {grade}.")
+        grade = int(raw_grade)
+    except (TypeError, ValueError):
+        return random.choice(GRADE_LEVELS), "invalid"
+    if grade < 9 or grade > 12:
+        return grade, "out_of_range"
+    return grade, None
+
+
+# Anything that isn't a letter or digit, in runs (spaces, dots, hyphens, apostrophes...)
+_EMAIL_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def generate_student_email(name):
+    """
+    Generate a school email because students never remember theirs anyway.
     
-    # Generate email because students never remember theirs anyway
-    email = f"{name.lower().replace(' ', '.')}@school.edu"
+    Args:
+        name (str): Student name
+        
+    Returns:
+        str: The email address ("Alex B. Procrastinator" -> alex.b.procrastinator@school.edu)
+    """
+    # Accents get stripped, and any run of spaces/punctuation becomes ONE dot -
+    # the mail server does not appreciate "alex.b..procrastinator"
+    local = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    local = _EMAIL_SEPARATORS.sub(".", local.lower()).strip(".")
+    return f"{local or 'student'}@school.edu"
+
+
+def create_student(name, grade, student_id, rng=random):
+    """
+    Build a new student dictionary with all the important stuff.
     
-    # Create the student dictionary with all the important stuff
-    student = {
+    The random picks use rng.random() directly instead of random.choice()
+    and random.randint() - same results, but several times faster, which
+    matters when a bulk import creates hundreds of thousands of students.
+    
+    Args:
+        name (str): Student name
+        grade (int): Grade level
+        student_id (int): Unique student ID
+        rng: Anything with a random() method (pass a random.Random(seed) for repeatable students)
+        
+    Returns:
+        dict: The new student dictionary (not added to any list yet)
+    """
+    roll = rng.random
+    return {
         "id": student_id,
         "name": name,
         "grade": grade,
-        "email": email,
+        "email": generate_student_email(name),
         "subjects": [],
         "grades": {
             "homework": [],
@@ -60,37 +336,50 @@ def add_student(students_list):
             "projects": []
         },
         "gpa": 0.0,
-        "attendance": random.randint(70, 98),
-        "disciplinary_actions": random.choice([0, 0, 0, 1, 2]),
-        "favorite_excuse": random.choice([
-            "My internet was down",
-            "I forgot we had school today",
-            "My cat deleted my homework",
-            "I was abducted by aliens",
-            "Time is a social construct"
-        ]),
+        "attendance": 70 + int(roll() * 29),
+        "disciplinary_actions": DISCIPLINARY_ODDS[int(roll() * 5)],
+        "favorite_excuse": FAVORITE_EXCUSES[int(roll() * len(FAVORITE_EXCUSES))],
         "social_media": {
-            "posts": [],
-            "followers": random.randint(50, 500),
-            "following": random.randint(100, 800),
-            "posts_about_school": []
+            "posts": array("q"),  # Post ids - the posts themselves live in the feed
+            "followers": 50 + int(roll() * 451),
+            "following": 100 + int(roll() * 701),
+            "posts_about_school": array("q")
         },
         "emergency_contact": "Mom (good luck reaching her)",
-        "dietary_restrictions": random.choice([
-            "None", "Vegetarian", "Allergic to vegetables", "Only eats pizza"
-        ]),
-        "transportation": random.choice([
-            "Bus", "Car", "Skateboard", "Pure willpower", "Teleportation"
-        ]),
+        "dietary_restrictions": DIETARY_RESTRICTIONS[int(roll() * len(DIETARY_RESTRICTIONS))],
+        "transportation": TRANSPORTATION_OPTIONS[int(roll() * len(TRANSPORTATION_OPTIONS))],
         "clubs": [],
-        "career_goals": random.choice([
-            "I have no idea",
-            "Internet famous", 
-            "Professional gamer",
-            "Something with computers",
-            "Anything that pays well"
-        ])
+        "career_goals": CAREER_GOALS[int(roll() * len(CAREER_GOALS))]
     }
+
+
+def add_student(students_list):
+    """
+    Add a new student to the system.
+    
+    Args:
+        students_list (list): List of existing students
+        
+    Returns:
+        dict: The newly created student dictionary
+    """
+    print("Adding a new student to our digital prison... I mean, system!")
+    
+    name = input("Student name (or nickname if they're too cool for real names): ")
+    if not name:
+        name = "Anonymous Troublemaker"
+    
+    # Get a student ID nobody else has (random IDs eventually collide!)
+    student_id = allocate_student_id(students_list)
+    
+    # Get grade level with error handling
+    grade, problem = parse_grade_level(input("Grade level (9-12, or just guess): "))
+    if problem == "out_of_range":
+        print("That's not a high school grade, but sure, let's go with it.")
+    elif problem == "invalid":
+        print(f"Invalid input. I'll just say they're in grade {grade}.")
+    
+    student = create_student(name, grade, student_id)
     
     students_list.append(student)
     print(f"Student {name} (ID: {student_id}) has been added to the system!")
@@ -98,6 +387,99 @@ def add_student(students_list):
     return student
 
 
+def _read_student_rows(path, file_format):
+    """
+    Stream raw rows out of a CSV or JSONL file, one at a time (private helper function).
+    
+    Args:
+        path (str): File to read
+        file_format (str): "csv" or "jsonl"
+        
+    Yields:
+        dict: One row (needs at least a "name", ideally a "grade"), or None
+            for a JSONL line that isn't valid JSON
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None
+
+
+def import_students(students_list, path, file_format=None, quiet=False):
+    """
+    Bulk-import students from a CSV or JSONL file.
+    
+    For when a whole district shows up at once and typing every name into
+    add_student() is not an option. Rows are streamed one at a time, so the
+    file never has to fit in memory. Grade levels and emails are handled
+    exactly like add_student() does, and IDs come from the same allocator.
+    Rows that can't be a student at all (broken JSON, a line that isn't an
+    object, a name that isn't text) are skipped and counted as rejected -
+    one bad line never sinks the whole import.
+    
+    Args:
+        students_list (list): List to add the students to (a StudentRegistry is fastest)
+        path (str): CSV file with a header row, or JSONL with one object per line
+        file_format (str): "csv" or "jsonl" (guessed from the file extension if omitted)
+        quiet (bool): Skip printing the import report
+        
+    Returns:
+        dict: Import report with counts, elapsed seconds and rows per second
+    """
+    if file_format is None:
+        file_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+    if file_format not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported file format: {file_format}")
+    
+    if isinstance(students_list, StudentRegistry):
+        allocate = students_list.id_allocator.allocate
+    else:
+        allocate = StudentIdAllocator.from_students(students_list).allocate
+    
+    report = {"imported": 0, "rejected": 0, "invalid_grades": 0, "out_of_range_grades": 0}
+    started = time.perf_counter()
+    
+    for row in _read_student_rows(path, file_format):
+        if not isinstance(row, dict):
+            report["rejected"] += 1
+            continue
+        name = row.get("name")
+        if name is not None and not isinstance(name, str):
+            report["rejected"] += 1
+            continue
+        name = (name or "").strip() or "Anonymous Troublemaker"
+        grade, problem = parse_grade_level(row.get("grade"))
+        if problem == "invalid":
+            report["invalid_grades"] += 1
+        elif problem == "out_of_range":
+            report["out_of_range_grades"] += 1
+        
+        students_list.append(create_student(name, grade, allocate()))
+        report["imported"] += 1
+    
+    elapsed = time.perf_counter() - started
+    report["seconds"] = elapsed
+    report["rows_per_second"] = report["imported"] / elapsed if elapsed > 0 else 0.0
+    
+    if not quiet:
+        print(f"📥 Imported {report['imported']} students from {path}")
+        print(f"   ({report['rows_per_second']:,.0f} rows/second in {elapsed:.2f}s)")
+        if report["rejected"]:
+            print(f"   {report['rejected']} rows were so broken we didn't even try")
+        if report["invalid_grades"]:
+            print(f"   {report['invalid_grades']} unreadable grade levels got a random grade")
+        if report["out_of_range_grades"]:
+            print(f"   {report['out_of_range_grades']} grade levels aren't 9-12, but we kept them anyway")
+    
+    return report
+
+
 def find_student_by_id(students_list, student_id):
     """
     Find a student by their ID number.
@@ -109,6 +491,9 @@ def find_student_by_id(students_list, student_id):
     Returns:
         dict or None: Student dictionary if found, None otherwise
     """
+    if isinstance(students_list, StudentRegistry):
+        return students_list.get_by_id(student_id)
+    
     for student in students_list:
         if student["id"] == student_id:
             return student
@@ -126,67 +511,227 @@ def find_student_by_name(students_list, name):
     Returns:
         dict or None: Student dictionary if found, None otherwise
     """
+    if isinstance(students_list, StudentRegistry):
+        return students_list.get_by_name(name)
+    
+    key = _name_key(name)
     for student in students_list:
-        if student["name"].lower() == name.lower():
+        if _name_key(student["name"]) == key:
             return student
     return None
 
 
-def generate_student_report(student):
+def suggest_students(students_list, name, limit=5):
     """
-    Generate a comprehensive report for a specific student.
+    Suggest students whose names start with or look like the given name.
+    
+    Args:
+        students_list (list): List of students to search
+        name (str): Partial or misspelled student name
+        limit (int): Maximum number of suggestions
+        
+    Returns:
+        list: Candidate student dictionaries, best match first
+    """
+    if isinstance(students_list, StudentRegistry):
+        return students_list.search(name, limit)
+    # Plain lists get a throwaway index. Works, but use a registry if you care about speed.
+    return NameSearchIndex(students_list).search(name, limit)
+
+
+def find_student_or_suggest(students_list, name):
+    """
+    Find a student by name, offering a pick list when there's no exact match.
+    
+    Args:
+        students_list (list): List of students to search
+        name (str): The (possibly partial or misspelled) student name
+        
+    Returns:
+        dict or None: The found or chosen student, None otherwise
+    """
+    student = find_student_by_name(students_list, name)
+    if student or not name.strip():
+        return student
+    
+    candidates = suggest_students(students_list, name)
+    if not candidates:
+        return None
+    
+    print("🤔 No exact match. Did you mean:")
+    for i, candidate in enumerate(candidates, 1):
+        print(f"  {i}. {candidate['name']} (ID: {candidate['id']}, Grade: {candidate['grade']})")
+    
+    choice = input("Pick a number (or press Enter to give up): ")
+    try:
+        index = int(choice) - 1
+    except ValueError:
+        return None
+    if 0 <= index < len(candidates):
+        return candidates[index]
+    return None
+
+
+# Functions that want to hear about attendance and discipline changes.
+# They get called as listener(student, field, old_value, new_value).
+_field_listeners = []
+
+
+def add_field_listener(listener):
+    """
+    Register a function to call whenever attendance or disciplinary actions change.
+    
+    Args:
+        listener (function): Called as listener(student, field, old_value, new_value)
+    """
+    _field_listeners.append(listener)
+
+
+def remove_field_listener(listener):
+    """
+    Stop calling a previously registered field listener.
+    
+    Args:
+        listener (function): The listener to remove
+    """
+    if listener in _field_listeners:
+        _field_listeners.remove(listener)
+
+
+def _store_field(student, field, value):
+    """
+    Write a new attendance or discipline value and tell the listeners (private helper).
+    
+    Args:
+        student (dict): Student to update
+        field (str): "attendance" or "disciplinary_actions"
+        value: The new value
+    """
+    old_value = student[field]
+    student[field] = value
+    if old_value != value:
+        for listener in _field_listeners:
+            listener(student, field, old_value, value)
+
+
+def update_attendance(student, attendance):
+    """
+    Set a student's attendance percentage.
+    
+    Args:
+        student (dict): The student
+        attendance (int): New attendance percentage (kept between 0 and 100)
+        
+    Returns:
+        int: The attendance that was stored
+        
+    Raises:
+        ValueError: If attendance isn't a finite number ("inf" and "nan" included)
+    """
+    if not math.isfinite(attendance):
+        raise ValueError(f"Attendance has to be a real percentage, not {attendance}")
+    attendance = max(0, min(100, int(attendance)))
+    _store_field(student, "attendance", attendance)
+    return attendance
+
+
+def record_disciplinary_action(student, count=1):
+    """
+    Add to a student's disciplinary record (or take some off with a negative count).
+    
+    Args:
+        student (dict): The student who got caught
+        count (int): How many actions to add
+        
+    Returns:
+        int: The student's new total (never below 0)
+    """
+    total = max(0, student["disciplinary_actions"] + count)
+    _store_field(student, "disciplinary_actions", total)
+    return total
+
+
+def render_student_report(student, social_media_posts=None):
+    """
+    Build a comprehensive report for a specific student as one string.
+    
+    Building the whole thing first and printing (or writing) it once is way
+    faster than ~25 separate print() calls, and it means the report can go
+    to a file, a buffer, or another process - not just the screen.
     
     Args:
         student (dict): The student dictionary to report on
+        social_media_posts (SocialFeed, list or dict): Where to look up the
+            student's recent school posts by id (without it, only the count shows)
+        
+    Returns:
+        str: The full report text
     """
-    if not student:
-        print("Student not found. Maybe they transferred to a better school?")
-        return
+    lines = []
+    add = lines.append
     
-    print(f"\n📋 STUDENT REPORT: {student['name']}")
-    print("=" * 50)
+    add(f"\n📋 STUDENT REPORT: {student['name']}")
+    add("=" * 50)
     
     # Basic information
-    print(f"Student ID: {student['id']}")
-    print(f"Grade Level: {student['grade']}")
-    print(f"Email: {student['email']}")
-    print(f"GPA: {student['gpa']:.2f}")
-    print(f"Attendance: {student['attendance']}%")
+    add(f"Student ID: {student['id']}")
+    add(f"Grade Level: {student['grade']}")
+    add(f"Email: {student['email']}")
+    add(f"GPA: {student['gpa']:.2f}")
+    add(f"Attendance: {student['attendance']}%")
     
     # Grades breakdown
-    print(f"\nGRADES BREAKDOWN:")
+    add(f"\nGRADES BREAKDOWN:")
     for category, grades in student["grades"].items():
         if grades:
             avg = sum(grades) / len(grades)
-            print(f"  {category.title()}: {avg:.1f}% (from {len(grades)} assignments)")
+            add(f"  {category.title()}: {avg:.1f}% (from {len(grades)} assignments)")
         else:
-            print(f"  {category.title()}: No grades yet")
+            add(f"  {category.title()}: No grades yet")
     
     # Personal information
-    print(f"\nPERSONAL INFO:")
-    print(f"  Favorite excuse: '{student['favorite_excuse']}'")
-    print(f"  Career goals: {student['career_goals']}")
-    print(f"  Transportation: {student['transportation']}")
-    print(f"  Dietary restrictions: {student['dietary_restrictions']}")
+    add(f"\nPERSONAL INFO:")
+    add(f"  Favorite excuse: '{student['favorite_excuse']}'")
+    add(f"  Career goals: {student['career_goals']}")
+    add(f"  Transportation: {student['transportation']}")
+    add(f"  Dietary restrictions: {student['dietary_restrictions']}")
     
     # Social media presence
-    print(f"\nSOCIAL MEDIA PRESENCE:")
-    print(f"  Followers: {student['social_media']['followers']}")
-    print(f"  Following: {student['social_media']['following']}")
-    print(f"  School-related posts: {len(student['social_media']['posts_about_school'])}")
+    add(f"\nSOCIAL MEDIA PRESENCE:")
+    add(f"  Followers: {student['social_media']['followers']}")
+    add(f"  Following: {student['social_media']['following']}")
+    add(f"  School-related posts: {len(student['social_media']['posts_about_school'])}")
     
-    if student['social_media']['posts_about_school']:
-        print("  Recent school posts:")
-        for post in student['social_media']['posts_about_school'][-3:]:
-            print(f"    - {post['post']} ({post['likes']} likes)")
+    recent_school_posts = resolve_posts(student['social_media']['posts_about_school'][-3:], social_media_posts)
+    if recent_school_posts:
+        add("  Recent school posts:")
+        for post in recent_school_posts:
+            add(f"    - {post.get('content', post.get('post'))} ({post['likes']} likes)")
     
     # Disciplinary record
     if student['disciplinary_actions'] > 0:
-        print(f"\nDISCIPLINARY RECORD:")
-        print(f"  Total actions: {student['disciplinary_actions']}")
-        print("  (Details confidential, but probably involved talking in class)")
+        add(f"\nDISCIPLINARY RECORD:")
+        add(f"  Total actions: {student['disciplinary_actions']}")
+        add("  (Details confidential, but probably involved talking in class)")
     else:
-        print(f"\nDISCIPLINARY RECORD: Clean! ✨")
+        add(f"\nDISCIPLINARY RECORD: Clean! ✨")
+    
+    return "\n".join(lines) + "\n"
+
+
+def generate_student_report(student, social_media_posts=None):
+    """
+    Generate a comprehensive report for a specific student.
+    
+    Args:
+        student (dict): The student dictionary to report on
+        social_media_posts (SocialFeed or list): Feed the student's posts live in
+    """
+    if not student:
+        print("Student not found. Maybe they transferred to a better school?")
+        return
+    
+    print(render_student_report(student, social_media_posts), end="")
 
 
 def load_sample_students():
@@ -0,0 +1,202 @@
+"""
+Trending Module
+
+What's hot on the school feed, without recounting every post ever made.
+
+get_trending_hashtags() used to tally every hashtag in the whole feed
+and then sort all of them, every single time. A HashtagCounter keeps the
+tally as posts come in instead, and picks the top few with a heap, so
+asking "what's trending?" costs the same with 100 posts or 10 million.
+
+All-time counts have a problem, though: whatever was hot last semester
+stays on top forever. A WindowedHashtagCounter only counts the last hour,
+day or week. Posts land in time buckets (say, one per hour for the "day"
+window), and whole buckets get thrown out once they slide out of the
+window, so memory depends on the window size, not on how long the school
+has been posting.
+
+Both count hashtag ids from a Vocabulary rather than the hashtag strings
+themselves. A SocialFeed turns a post's hashtags into ids once and hands
+the same ids to all of its counters, so each hashtag gets hashed as a
+string once per post instead of once per counter.
+
+Classes:
+- HashtagCounter: Running hashtag counts with heap-based top-N
+- WindowedHashtagCounter: Hashtag counts for a sliding time window
+"""
+
+import bisect
+import datetime
+import heapq
+from operator import itemgetter
+
+from vocabulary import Vocabulary
+
+# Trending windows: name -> (window length, bucket size), both in seconds
+TRENDING_WINDOWS = {
+    "hour": (60 * 60, 60),
+    "day": (24 * 60 * 60, 60 * 60),
+    "week": (7 * 24 * 60 * 60, 6 * 60 * 60)
+}
+
+
+def post_time(post):
+    """
+    When a post was published, in seconds (for bucketing).
+
+    Args:
+        post (dict): Post with an ISO format "timestamp"
+
+    Returns:
+        float: Seconds since the epoch
+    """
+    return datetime.datetime.fromisoformat(post["timestamp"]).timestamp()
+
+
+class HashtagCounter:
+    """
+    All-time hashtag counts, updated one post at a time.
+
+    Hashtags are counted in the order they first showed up, so ties come
+    out the same way the old sort-everything version had them. Counts are
+    kept per hashtag id (see Vocabulary); top() turns them back into words.
+    """
+
+    def __init__(self, posts=(), vocabulary=None):
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.counts = {}  # Hashtag id -> count
+        for post in posts:
+            self.add_post(post)
+
+    def add_post(self, post):
+        """
+        Count a newly published post's hashtags.
+
+        Args:
+            post (dict): The post
+        """
+        hashtags = post.get("hashtags")
+        if hashtags:
+            self.add_ids(self.vocabulary.encode(hashtags))
+
+    def add_ids(self, hashtag_ids):
+        """
+        Count hashtags that were already turned into ids.
+
+        Args:
+            hashtag_ids (list): Ids from this counter's vocabulary
+        """
+        counts = self.counts
+        for hashtag_id in hashtag_ids:
+            counts[hashtag_id] = counts.get(hashtag_id, 0) + 1
+
+    def top(self, top_n=5):
+        """
+        The most used hashtags.
+
+        Uses a heap of size top_n over the distinct hashtags, which is
+        O(H log N) for H hashtags - the number of posts doesn't matter.
+
+        Args:
+            top_n (int): How many hashtags to return
+
+        Returns:
+            list: (hashtag, count) tuples, most used first
+        """
+        words = self.vocabulary.words
+        return [(words[hashtag_id], count)
+                for hashtag_id, count in heapq.nlargest(top_n, self.counts.items(), key=itemgetter(1))]
+
+
+class WindowedHashtagCounter:
+    """
+    Hashtag counts for the last `window_seconds`, in `bucket_seconds` buckets.
+
+    "Now" is the newest post seen so far (or a later time passed to
+    top()), so a feed full of old posts still has something trending. The
+    window is accurate to within one bucket. Posts older than the window
+    are ignored; slightly out-of-order posts inside it are fine.
+    """
+
+    def __init__(self, window_seconds, bucket_seconds, posts=(), vocabulary=None):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self._span = -(-window_seconds // bucket_seconds)  # Buckets per window, rounded up
+        self.counts = {}    # Hashtag id -> count inside the window
+        self._buckets = {}  # Bucket number -> {hashtag id: count}
+        self._order = []    # Bucket numbers, oldest first
+        self._newest = None
+        for post in posts:
+            self.add_post(post)
+
+    def _advance(self, bucket):
+        """Move "now" forward to a bucket and drop buckets that fell out of the window (private helper)."""
+        if self._newest is not None and bucket <= self._newest:
+            return
+        self._newest = bucket
+        cutoff = bucket - self._span + 1
+        expired = 0
+        for old_bucket in self._order:
+            if old_bucket >= cutoff:
+                break
+            for hashtag_id, count in self._buckets.pop(old_bucket).items():
+                remaining = self.counts[hashtag_id] - count
+                if remaining:
+                    self.counts[hashtag_id] = remaining
+                else:
+                    del self.counts[hashtag_id]
+            expired += 1
+        del self._order[:expired]
+
+    def add_post(self, post, posted_at=None):
+        """
+        Count a post's hashtags in the bucket for its timestamp.
+
+        Args:
+            post (dict): The post
+            posted_at (float): post_time(post), if you already worked it out
+        """
+        hashtags = post.get("hashtags")
+        if hashtags:
+            self.add_ids(self.vocabulary.encode(hashtags),
+                         post_time(post) if posted_at is None else posted_at)
+
+    def add_ids(self, hashtag_ids, posted_at):
+        """
+        Count hashtags that were already turned into ids.
+
+        Args:
+            hashtag_ids (list): Ids from this counter's vocabulary
+            posted_at (float): When the post was published (see post_time())
+        """
+        bucket = int(posted_at // self.bucket_seconds)
+        self._advance(bucket)
+        if bucket <= self._newest - self._span:
+            return  # Too old to be trending
+
+        bucket_counts = self._buckets.get(bucket)
+        if bucket_counts is None:
+            bucket_counts = self._buckets[bucket] = {}
+            bisect.insort(self._order, bucket)
+        counts = self.counts
+        for hashtag_id in hashtag_ids:
+            bucket_counts[hashtag_id] = bucket_counts.get(hashtag_id, 0) + 1
+            counts[hashtag_id] = counts.get(hashtag_id, 0) + 1
+
+    def top(self, top_n=5, now=None):
+        """
+        The most used hashtags inside the window.
+
+        Args:
+            top_n (int): How many hashtags to return
+            now (datetime.datetime): End of the window (defaults to the newest post)
+
+        Returns:
+            list: (hashtag, count) tuples, most used first
+        """
+        if now is not None:
+            self._advance(int(now.timestamp() // self.bucket_seconds))
+        words = self.vocabulary.words
+        return [(words[hashtag_id], count)
+                for hashtag_id, count in heapq.nlargest(top_n, self.counts.items(), key=itemgetter(1))]
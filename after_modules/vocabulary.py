@@ -0,0 +1,101 @@
+"""
+Vocabulary Module
+
+Say "#homework" once. After that it's just number 5.
+
+Every post repeats the same handful of hashtags and one of a few thousand
+student names, over and over. A Vocabulary hands each distinct word a
+small integer id the first time it shows up, so counters can count ints
+instead of hashing strings, and save files can write 5 instead of
+"#homework" for the millionth time. Every post that goes through the same
+vocabulary also shares one copy of each word.
+
+Classes:
+- Vocabulary: Two-way mapping between words and small integer ids
+"""
+
+
+class Vocabulary:
+    """
+    Words in the order they were first seen, and their ids (positions).
+
+    Ids never change once handed out, so anything stored as ids stays
+    valid as the vocabulary grows.
+    """
+
+    def __init__(self, words=()):
+        self.words = []
+        self._ids = {}
+        for word in words:
+            self.id_for(word)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self._ids
+
+    def id_for(self, word):
+        """
+        A word's id, handing out the next one if it's new.
+
+        Args:
+            word (str): The word
+
+        Returns:
+            int: Its id
+        """
+        word_id = self._ids.get(word)
+        if word_id is None:
+            word_id = self._ids[word] = len(self.words)
+            self.words.append(word)
+        return word_id
+
+    def id_of(self, word):
+        """
+        A word's id, without adding it.
+
+        Args:
+            word (str): The word
+
+        Returns:
+            int: Its id, or None if the vocabulary has never seen it
+        """
+        return self._ids.get(word)
+
+    def word(self, word_id):
+        """
+        The word behind an id.
+
+        Args:
+            word_id (int): An id from id_for()
+
+        Returns:
+            str: The word
+        """
+        return self.words[word_id]
+
+    def encode(self, words):
+        """
+        Ids for several words (new ones get added).
+
+        Args:
+            words (iterable): The words
+
+        Returns:
+            list: Their ids, in the same order
+        """
+        return [self.id_for(word) for word in words]
+
+    def decode(self, word_ids):
+        """
+        The words behind several ids.
+
+        Args:
+            word_ids (iterable): Ids from id_for() or encode()
+
+        Returns:
+            list: The words, in the same order
+        """
+        words = self.words
+        return [words[word_id] for word_id in word_ids]
@@ -0,0 +1,58 @@
+import math
+
+from aggregations import group_by, group_by_parallel, merge_groups
+from roster_generator import generate_roster
+
+
+def _students():
+    return [
+        {"grade": 9, "transportation": "Bus", "clubs": ["Chess Club", "Band"], "gpa": 80.0},
+        {"grade": 9, "transportation": "Bus", "clubs": ["Band"], "gpa": None},
+        {"grade": 10, "transportation": "Walk", "clubs": [], "gpa": 90.0},
+        {"grade": 10, "transportation": "Bus", "clubs": ["Chess Club"], "gpa": 70.0,
+         "social_media": {"followers": 300}},
+    ]
+
+
+def test_group_by_counts_everyone_but_averages_only_present_values():
+    groups = group_by(_students(), "grade", "gpa")
+
+    assert groups[9] == {"count": 2, "value_count": 1, "sum": 80.0, "mean": 80.0, "min": 80.0, "max": 80.0}
+    assert groups[10]["count"] == 2
+    assert groups[10]["mean"] == 80.0
+
+
+def test_list_fields_count_once_per_item_and_counting_needs_no_value():
+    assert group_by(_students(), "clubs") == {"Chess Club": {"count": 2}, "Band": {"count": 2}}
+    assert group_by(_students(), "clubs", "gpa")["Band"]["mean"] == 80.0
+
+
+def test_dotted_paths_and_missing_values():
+    groups = group_by(_students(), "transportation", "social_media.followers")
+    assert groups["Bus"]["value_count"] == 1
+    assert groups["Walk"]["mean"] is None
+
+
+def test_merge_groups_adds_counts_and_compares_extremes():
+    first = {"Bus": {"count": 2, "value_count": 1, "sum": 5, "min": 5, "max": 5}}
+    second = {"Bus": {"count": 1, "value_count": 1, "sum": 9, "min": 9, "max": 9},
+              "Walk": {"count": 1, "value_count": 0, "sum": 0, "min": None, "max": None}}
+
+    merged = merge_groups(first, second)
+
+    assert merged["Bus"] == {"count": 3, "value_count": 2, "sum": 14, "min": 5, "max": 9}
+    assert merged["Walk"]["count"] == 1
+
+
+def test_group_by_parallel_matches_group_by():
+    students, _posts = generate_roster(500, seed=3)
+    for group_field, value_field in [("transportation", "attendance"), ("clubs", "gpa"), ("grade", None)]:
+        serial = group_by(students, group_field, value_field)
+        parallel = group_by_parallel(students, group_field, value_field, processes=2, chunksize=64)
+        assert serial.keys() == parallel.keys()
+        for key, bucket in serial.items():
+            for stat, value in bucket.items():
+                if isinstance(value, float):
+                    assert math.isclose(value, parallel[key][stat])
+                else:
+                    assert value == parallel[key][stat]
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from grade_history import SemesterHistory
+from student_utils import create_student
+
+
+def _student(name, student_id, gpa, tests=()):
+    student = create_student(name, 11, student_id)
+    student["gpa"] = gpa
+    student["grades"]["tests"] = list(tests)
+    return student
+
+
+def test_student_history_rebuilds_values_from_deltas():
+    alex = _student("Alex Procrastinator", 10001, 2.5, [70, 80])
+    history = SemesterHistory()
+    history.record_semester("Fall 2024", [alex])
+    alex["gpa"] = 3.25
+    alex["grades"]["tests"].append(96)
+    history.record_semester("Spring 2025", [alex])
+
+    assert history.trajectory(10001) == [("Fall 2024", 2.5), ("Spring 2025", 3.25)]
+    assert history.trajectory(10001, "tests") == [("Fall 2024", 75.0), ("Spring 2025", 82.0)]
+    assert history.student_history(99999) == [("Fall 2024", None), ("Spring 2025", None)]
+
+
+def test_missed_semesters_and_big_jumps_survive():
+    riley = _student("Riley Crammer", 10002, 1.0)
+    history = SemesterHistory()
+    history.record_semester("Fall 2024", [riley])
+    history.record_semester("Spring 2025", [])  # Transferred out for a semester
+    riley["gpa"] = 400.0  # Too big a jump for a two-byte delta
+    history.record_semester("Fall 2025", [riley])
+
+    assert history.trajectory(10002) == [("Fall 2024", 1.0), ("Spring 2025", None), ("Fall 2025", 400.0)]
+    assert history._rows[10002][1].typecode == "i"
+
+
+def test_class_deltas_separate_returning_students_from_newcomers():
+    alex = _student("Alex Procrastinator", 10001, 2.0)
+    history = SemesterHistory()
+    history.record_semester("Fall 2024", [alex, alex])  # Duplicates only count once
+    alex["gpa"] = 3.0
+    newcomer = _student("Sam Overachiever", 10003, 4.0)
+    history.record_semester("Spring 2025", [alex, newcomer])
+
+    assert history.class_summaries[0]["students"] == 1
+    [delta] = history.class_deltas()
+    assert delta["average"] == pytest.approx(3.5)
+    assert delta["change"] == pytest.approx(1.5)
+    assert delta["returning_change"] == pytest.approx(1.0)
+    assert delta["returning_students"] == 1
+
+    with pytest.raises(ValueError):
+        history.record_semester("Fall 2024", [alex])
+
+
+def test_to_dict_round_trip_keeps_recording_from_the_right_baseline():
+    alex = _student("Alex Procrastinator", 10001, 2.5, [70])
+    sam = _student("Sam Overachiever", 10003, 3.9, [99])
+    history = SemesterHistory()
+    history.record_semester("Fall 2024", [alex, sam])
+    history.record_semester("Spring 2025", [sam])
+
+    reloaded = SemesterHistory.from_dict(json.loads(json.dumps(history.to_dict())))
+    alex["gpa"] = 3.0
+    reloaded.record_semester("Fall 2025", [alex, sam])
+
+    assert reloaded.metrics == history.metrics
+    assert reloaded.trajectory(10001) == [("Fall 2024", 2.5), ("Spring 2025", None), ("Fall 2025", 3.0)]
+    assert reloaded.trajectory(10003, "tests") == [("Fall 2024", 99.0), ("Spring 2025", 99.0), ("Fall 2025", 99.0)]
+    assert reloaded.class_deltas()[0] == history.class_deltas()[0]
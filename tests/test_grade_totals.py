@@ -0,0 +1,70 @@
+import json
+
+from grade_calculator import (
+    calculate_gpa, clear_gpa_cache, grade_summary_view, incremental_gpa,
+    profile_gpa, record_grade,
+)
+from student_record import StudentRecord
+from student_utils import create_student
+
+
+def _student(student_id=3001):
+    return create_student("Alex Procrastinator", 11, student_id)
+
+
+def test_running_totals_stay_out_of_the_student():
+    student = _student()
+    keys = set(student)
+    record_grade(student, "tests", 90)
+    record_grade(student, "homework", 70)
+    profile_gpa(student)
+    grade_summary_view(student)
+
+    assert set(student) == keys
+    record = StudentRecord.from_dict(student)
+    assert json.loads(json.dumps(record.to_dict(), default=list)).keys() == keys
+
+
+def test_record_grade_matches_full_recalculation():
+    student = _student()
+    for category, grade in [("tests", 88), ("homework", 100), ("tests", 61), ("projects", 75)]:
+        gpa = record_grade(student, category, grade, verify=True)
+    assert gpa == calculate_gpa(student)
+
+
+def test_calculate_gpa_resyncs_after_an_in_place_edit():
+    student = _student()
+    record_grade(student, "tests", 100)
+    record_grade(student, "tests", 100)
+    student["grades"]["tests"][0] = 0
+
+    assert calculate_gpa(student) == 50
+    assert incremental_gpa(student) == 50
+    assert profile_gpa(student) == 50
+
+
+def test_a_new_student_with_an_old_id_gets_fresh_caches():
+    first = _student()
+    record_grade(first, "tests", 40)
+    assert profile_gpa(first) == 40
+
+    second = _student()  # Same id, different student (a reloaded roster, say)
+    second["grades"]["tests"].append(95)
+    assert profile_gpa(second) == 95
+    assert grade_summary_view(second)["tests"].average == 95
+    clear_gpa_cache()
+
+
+def test_recalculating_unchanged_grades_keeps_the_caches():
+    student = _student(3002)
+    record_grade(student, "tests", 80)
+    view = grade_summary_view(student)
+    assert profile_gpa(student) == 80
+
+    calculate_gpa(student)
+    assert grade_summary_view(student) is view
+
+    student["grades"]["tests"][0] = 60
+    calculate_gpa(student)
+    assert grade_summary_view(student) is not view
+    assert profile_gpa(student) == 60
@@ -0,0 +1,76 @@
+import math
+
+from grade_calculator import calculate_gpa, import_grades
+from student_utils import StudentRegistry, create_student
+
+
+def _roster():
+    return StudentRegistry([
+        create_student("Alex Procrastinator", 11, 1001),
+        create_student("Sam Overachiever", 12, 1002),
+    ])
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_csv_import_appends_grades_and_recalculates_gpa(tmp_path):
+    students = _roster()
+    path = _write(tmp_path / "grades.csv", (
+        "student_id,category,score\n"
+        "1001,tests,80\n"
+        "1001,homework,90\n"
+        "1002,Tests,100\n"
+    ))
+
+    report = import_grades(students, path, quiet=True)
+
+    assert report["imported"] == 3
+    assert report["students"] == 2
+    alex = students.get_by_id(1001)
+    assert alex["grades"]["tests"] == [80.0]
+    assert alex["grades"]["homework"] == [90.0]
+    assert alex["gpa"] == calculate_gpa(alex)
+    assert students.get_by_id(1002)["grades"]["tests"] == [100.0]
+
+
+def test_csv_import_skips_nan_and_inf_scores(tmp_path):
+    students = _roster()
+    path = _write(tmp_path / "grades.csv", (
+        "student_id,category,score\n"
+        "1001,tests,nan\n"
+        "1001,tests,inf\n"
+        "1001,tests,-inf\n"
+        "1001,tests,NaN\n"
+        "1001,tests,85\n"
+        "1002,homework,Infinity\n"
+    ))
+
+    report = import_grades(students, path, quiet=True)
+
+    assert report["imported"] == 1
+    assert report["invalid_scores"] == 5
+    for student in students:
+        assert all(math.isfinite(grade) for grades in student["grades"].values() for grade in grades)
+        assert math.isfinite(student["gpa"])
+    assert students.get_by_id(1001)["grades"]["tests"] == [85.0]
+
+
+def test_jsonl_import_counts_unknown_students_and_categories(tmp_path):
+    students = _roster()
+    path = _write(tmp_path / "grades.jsonl", (
+        '{"name": "alex procrastinator", "category": "projects", "score": 70}\n'
+        '{"name": "Nobody Atall", "category": "tests", "score": 99}\n'
+        '{"student_id": 1002, "category": "napping", "score": 100}\n'
+        '{"student_id": 1002, "category": "tests", "score": "not a number"}\n'
+    ))
+
+    report = import_grades(students, path, quiet=True)
+
+    assert report["imported"] == 1
+    assert report["unknown_students"] == 1
+    assert report["unknown_categories"] == 1
+    assert report["invalid_scores"] == 1
+    assert students.get_by_id(1001)["grades"]["projects"] == [70.0]
@@ -0,0 +1,45 @@
+from student_utils import StudentRegistry, create_student, import_students
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_csv_import_adds_students_with_fresh_ids(tmp_path):
+    students = StudentRegistry([create_student("Alex Procrastinator", 11, 10000)])
+    path = _write(tmp_path / "students.csv", (
+        "name,grade\n"
+        "Sam Overachiever,12\n"
+        "  Jordan Napper  ,nine\n"
+        ",7\n"
+    ))
+
+    report = import_students(students, path, quiet=True)
+
+    assert report["imported"] == 3
+    assert report["invalid_grades"] == 1
+    assert report["out_of_range_grades"] == 1
+    assert len({student["id"] for student in students}) == 4
+    assert students.get_by_name("jordan napper")["grade"] in (9, 10, 11, 12)
+    assert students.get_by_name("Anonymous Troublemaker")["grade"] == 7
+    assert students.get_by_name("Sam Overachiever")["email"] == "sam.overachiever@school.edu"
+
+
+def test_jsonl_import_rejects_broken_rows_without_crashing(tmp_path):
+    students = StudentRegistry()
+    path = _write(tmp_path / "students.jsonl", (
+        '{"name": "Riley Crammer", "grade": 10}\n'
+        '{"name": 123, "grade": 10}\n'
+        '{"name": ["not", "a", "name"]}\n'
+        '["just", "a", "list"]\n'
+        '{"name": "Half a line...\n'
+        '\n'
+        '{"grade": 11}\n'
+    ))
+
+    report = import_students(students, path, quiet=True)
+
+    assert report["imported"] == 2
+    assert report["rejected"] == 4
+    assert [student["name"] for student in students] == ["Riley Crammer", "Anonymous Troublemaker"]
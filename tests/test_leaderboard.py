@@ -0,0 +1,85 @@
+import random
+
+from grade_calculator import record_grade
+from leaderboard import GpaLeaderboard, IndexableSkipList
+from student_utils import StudentRegistry, create_student
+
+
+def _student(name, grade_level, student_id, gpa):
+    student = create_student(name, grade_level, student_id)
+    student["gpa"] = gpa
+    return student
+
+
+def test_skip_list_matches_a_sorted_list_through_inserts_and_removes():
+    rng = random.Random(3)
+    skip_list = IndexableSkipList(seed=3)
+    expected = []
+    for key in rng.sample(range(10000), 500):
+        skip_list.insert(key, f"value {key}")
+        expected.append(key)
+    for key in rng.sample(expected, 200):
+        skip_list.remove(key)
+        expected.remove(key)
+    expected.sort()
+
+    assert len(skip_list) == len(expected)
+    assert list(skip_list) == [f"value {key}" for key in expected]
+    for position in (0, 1, 150, len(expected) - 1):
+        assert skip_list.index(expected[position]) == position
+        assert skip_list.values_from(position, 3) == [f"value {key}" for key in expected[position:position + 3]]
+    assert skip_list.index(-1) is None
+    assert skip_list.values_from(len(expected), 5) == []
+
+
+def test_skip_list_remove_of_a_missing_key_raises_key_error():
+    skip_list = IndexableSkipList(seed=1)
+    skip_list.insert(5, "five")
+    try:
+        skip_list.remove(6)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected KeyError")
+    assert list(skip_list) == ["five"]
+
+
+def test_rankings_skip_ungraded_students_and_break_ties_by_id():
+    alex = _student("Alex Procrastinator", 11, 10002, 3.1)
+    sam = _student("Sam Overachiever", 12, 10001, 3.9)
+    riley = _student("Riley Crammer", 11, 10003, 3.1)
+    newbie = _student("Jordan Napper", 9, 10004, 0.0)
+    leaderboard = GpaLeaderboard([alex, sam, riley, newbie])
+
+    assert len(leaderboard) == 3
+    assert leaderboard.top(10) == [sam, alex, riley]
+    assert leaderboard.bottom(2) == [riley, alex]
+    assert leaderboard.rank(riley) == 3
+    assert leaderboard.rank(riley, grade_level=11) == 2
+    assert leaderboard.rank(riley, grade_level=12) is None
+    assert leaderboard.rank(newbie) is None
+    assert leaderboard.top(5, grade_level=10) == []
+
+
+def test_attached_leaderboard_follows_gpa_and_roster_changes():
+    alex = _student("Alex Procrastinator", 11, 10001, 2.0)
+    sam = _student("Sam Overachiever", 11, 10002, 3.5)
+    students = StudentRegistry([alex, sam])
+    leaderboard = GpaLeaderboard(students).attach()
+    try:
+        for _ in range(5):
+            record_grade(alex, "tests", 100)
+        assert leaderboard.top(2) == [alex, sam]
+
+        riley = _student("Riley Crammer", 12, 10003, 3.8)
+        students.append(riley)
+        assert leaderboard.rank(riley) == 2
+
+        students.remove(alex)
+        assert leaderboard.top(5) == [riley, sam]
+        assert leaderboard.rank(alex) is None
+    finally:
+        leaderboard.detach()
+
+    record_grade(sam, "tests", 100)
+    assert leaderboard.top(5) == [riley, sam]  # Detached - no longer listening
@@ -0,0 +1,25 @@
+from grade_calculator import calculate_gpa, recalculate_all_gpas
+from roster_generator import generate_roster
+
+
+def test_pooled_recalculation_matches_calculate_gpa():
+    students, _posts = generate_roster(300, seed=11)
+    expected = [calculate_gpa(student) for student in students]
+    for student in students:
+        student["gpa"] = -1.0
+
+    summary = recalculate_all_gpas(students, processes=2, chunksize=64, quiet=True)
+
+    assert summary["students"] == 300
+    assert [student["gpa"] for student in students] == expected
+
+
+def test_serial_recalculation_is_the_default():
+    students, _posts = generate_roster(50, seed=12)
+    expected = [student["gpa"] for student in students]
+    for student in students:
+        student["gpa"] = -1.0
+
+    recalculate_all_gpas(students, quiet=True)
+
+    assert [student["gpa"] for student in students] == expected
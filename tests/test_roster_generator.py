@@ -0,0 +1,50 @@
+import json
+
+from grade_calculator import calculate_gpa
+from roster_generator import generate_roster, write_roster
+from social_feed import SocialFeed, resolve_posts
+
+
+def test_same_seed_same_roster():
+    first, first_feed = generate_roster(200, seed=9)
+    second, second_feed = generate_roster(200, seed=9)
+    assert first == second
+    assert first_feed == second_feed
+
+
+def test_generated_students_are_consistent():
+    students, feed = generate_roster(300, seed=4)
+
+    assert [student["id"] for student in students] == list(range(10000, 10300))
+    assert [post["id"] for post in feed] == list(range(len(feed)))
+    assert [post["timestamp"] for post in feed] == sorted(post["timestamp"] for post in feed)
+    for student in students:
+        grades = [grade for category in student["grades"].values() for grade in category]
+        assert all(0 <= grade <= 100 for grade in grades)
+        assert len(set(student["subjects"])) == len(student["subjects"])
+        assert student["gpa"] == calculate_gpa(student)
+        for post in resolve_posts(student["social_media"]["posts"], feed):
+            assert post["student"] == student["name"]
+
+
+def test_write_roster_matches_the_save_file_formats(tmp_path):
+    students_path = tmp_path / "students.json"
+    posts_path = tmp_path / "posts.json"
+
+    written = write_roster(120, str(students_path), str(posts_path), seed=6)
+
+    students = json.loads(students_path.read_text(encoding="utf-8"))
+    feed = SocialFeed.from_dict(json.loads(posts_path.read_text(encoding="utf-8")), capacity=10)
+    try:
+        assert written == (120, len(feed))
+        assert len(students) == 120
+        for student in students:
+            for post in resolve_posts(student["social_media"]["posts"], feed):
+                assert post["student"] == student["name"]
+    finally:
+        feed.close()
+
+    jsonl_path = tmp_path / "students.jsonl"
+    write_roster(120, str(jsonl_path), file_format="jsonl", seed=6)
+    lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == students
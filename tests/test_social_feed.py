@@ -0,0 +1,98 @@
+import json
+import os
+
+from social_feed import SocialFeed, link_student_posts, resolve_posts
+from student_utils import create_student
+
+
+def _posts(count):
+    return [
+        {
+            "student": f"Student {number % 5}",
+            "content": f"Post number {number}",
+            "timestamp": f"2024-09-02T08:{number // 60 % 60:02d}:{number % 60:02d}",
+            "likes": number,
+            "comments": number % 3,
+            "hashtags": ["#homework", "#mondays"][:number % 3],
+        }
+        for number in range(count)
+    ]
+
+
+def test_ids_are_positions_across_archive_and_recent_posts():
+    feed = SocialFeed(_posts(40), capacity=10)
+    try:
+        assert len(feed) == 40
+        for post_id in (0, 17, 29, 30, 39):
+            post = feed[post_id]
+            assert post["id"] == post_id
+            assert post["content"] == f"Post number {post_id}"
+        assert [post["id"] for post in feed] == list(range(40))
+        assert [post["id"] for post in reversed(feed)] == list(range(39, -1, -1))
+    finally:
+        feed.close()
+
+
+def test_newest_first_only_reads_the_archived_posts_it_returns(monkeypatch):
+    feed = SocialFeed(_posts(1000), capacity=10)
+    reads = []
+    read_archived = feed._read_archived
+    monkeypatch.setattr(feed, "_read_archived", lambda post_id: reads.append(post_id) or read_archived(post_id))
+    try:
+        newest = list(feed.newest_first(15))
+        assert [post["id"] for post in newest] == list(range(999, 984, -1))
+        assert reads == list(range(989, 984, -1))
+    finally:
+        feed.close()
+
+
+def test_to_dict_round_trip_keeps_ids_and_posts(tmp_path):
+    posts = _posts(25)
+    posts[3]["mood"] = "tired"  # Unknown keys ride along
+    feed = SocialFeed(posts, capacity=4)
+    saved = json.loads(json.dumps(feed.to_dict()))
+    feed.close()
+
+    reloaded = SocialFeed.from_dict(saved, capacity=4, archive_path=str(tmp_path / "archive.jsonl"))
+    try:
+        assert saved["hashtags"] == ["#homework", "#mondays"]
+        assert list(reloaded) == posts  # append() gave the originals their ids too
+        assert [post["id"] for post in reloaded] == list(range(25))
+        assert reloaded[3]["mood"] == "tired"
+    finally:
+        reloaded.close()
+
+
+def test_each_feed_gets_its_own_temp_archive_and_close_deletes_it():
+    first = SocialFeed(_posts(20), capacity=5)
+    second = SocialFeed(_posts(20), capacity=5)
+    paths = first.archive_path, second.archive_path
+    assert paths[0] != paths[1]
+    assert all(os.path.exists(path) for path in paths)
+
+    first.close()
+    second.close()
+    assert not any(os.path.exists(path) for path in paths)
+
+
+def test_small_feeds_never_create_an_archive_file():
+    feed = SocialFeed(_posts(5), capacity=10)
+    assert feed.archive_path is None
+    feed.close()
+
+
+def test_link_student_posts_swaps_embedded_posts_for_ids():
+    feed = SocialFeed(_posts(3), capacity=2)
+    student = create_student("Student 1", 10, 4001)
+    embedded = dict(_posts(3)[1])
+    brand_new = {"content": "Only I had this one", "timestamp": "2024-09-03T09:00:00", "likes": 1}
+    student["social_media"]["posts"] = [embedded, brand_new]
+    try:
+        assert link_student_posts([student], feed) == 2
+        post_ids = student["social_media"]["posts"]
+        assert post_ids.tolist() == [1, 3]
+        assert [post["content"] for post in resolve_posts(post_ids, feed)] == [
+            "Post number 1", "Only I had this one"
+        ]
+    finally:
+        feed.close()
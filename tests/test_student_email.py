@@ -0,0 +1,20 @@
+import re
+
+from roster_generator import generate_students
+from student_utils import generate_student_email
+
+# Letters/digits in dot-separated parts - no leading, trailing or doubled dots
+EMAIL_PATTERN = re.compile(r"^[a-z0-9]+(\.[a-z0-9]+)*@[a-z0-9-]+(\.[a-z0-9-]+)*\.[a-z]+$")
+
+
+def test_every_generated_email_is_a_valid_address():
+    for student, _posts in generate_students(2000, seed=7):
+        assert EMAIL_PATTERN.match(student["email"]), student["email"]
+
+
+def test_punctuation_and_extra_spaces_collapse_to_single_dots():
+    assert generate_student_email("Alex B. Procrastinator") == "alex.b.procrastinator@school.edu"
+    assert generate_student_email("  Mary-Jane  O'Neil ") == "mary.jane.o.neil@school.edu"
+    assert generate_student_email("José Núñez") == "jose.nunez@school.edu"
+    for name in ("Alex B. Procrastinator", "..Dot..Com..", "!!!", "Zoë St. James-Smith"):
+        assert EMAIL_PATTERN.match(generate_student_email(name)), name
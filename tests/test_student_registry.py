@@ -0,0 +1,93 @@
+import pytest
+
+from id_allocator import StudentIdAllocator
+from student_utils import (
+    StudentRegistry, allocate_student_id, create_student, find_student_by_id,
+    find_student_by_name,
+)
+
+
+def _students():
+    return [
+        create_student("Alex Procrastinator", 11, 10001),
+        create_student("Straße Overachiever", 12, 10002),
+        create_student("alex procrastinator", 9, 10003),  # Same name, different case
+    ]
+
+
+@pytest.mark.parametrize("container", [list, StudentRegistry])
+@pytest.mark.parametrize("query, expected", [
+    ("ALEX PROCRASTINATOR", 10001),
+    ("STRASSE OVERACHIEVER", 10002),
+    ("straße overachiever", 10002),
+    ("Nobody", None),
+])
+def test_name_lookup_is_the_same_for_lists_and_registries(container, query, expected):
+    student = find_student_by_name(container(_students()), query)
+    assert (student["id"] if student else None) == expected
+
+
+def test_registry_indexes_follow_adds_and_removals():
+    students = StudentRegistry(_students())
+    assert students.get_by_id(10003)["grade"] == 9
+    assert students.get_by_name("ALEX PROCRASTINATOR")["id"] == 10001  # First one wins
+
+    students.remove(students.get_by_id(10001))
+    assert students.get_by_id(10001) is None
+    assert students.get_by_name("Alex Procrastinator")["id"] == 10003
+
+    students.insert(0, create_student("Alex Procrastinator", 10, 10004))
+    assert students.get_by_name("alex procrastinator")["id"] == 10004
+
+    students[0] = create_student("Jordan Napper", 10, 10005)
+    assert students.get_by_id(10004) is None
+    assert find_student_by_id(students, 10005)["name"] == "Jordan Napper"
+
+    del students[:]
+    assert students.get_by_id(10005) is None
+    assert students.get_by_name("Jordan Napper") is None
+
+
+def test_reindex_picks_up_renamed_students():
+    students = StudentRegistry(_students())
+    students.get_by_id(10002)["name"] = "Sam Renamed"
+    students.reindex()
+    assert students.get_by_name("sam renamed")["id"] == 10002
+    assert students.get_by_name("Straße Overachiever") is None
+
+
+def test_new_ids_never_collide_with_loaded_ones():
+    students = StudentRegistry(_students())
+    students.append(create_student("Typed In", 10, 25000))
+
+    assert allocate_student_id(students) == 25001
+    assert allocate_student_id(students) == 25002
+    assert allocate_student_id(list(students)) == 25001
+    assert StudentIdAllocator(start=5, max_gap=3, seed=1).allocate() == 5
+
+
+def test_listeners_hear_about_every_change():
+    students = StudentRegistry(_students())
+    events = []
+    listener = lambda event, student: events.append((event, student["id"]))
+    students.add_listener(listener)
+
+    students.append(create_student("Newbie", 9, 10010))
+    students.pop()
+    students.clear()
+    students.remove_listener(listener)
+    students.append(create_student("Unheard", 9, 10011))
+
+    assert events == [
+        ("added", 10010), ("removed", 10010),
+        ("removed", 10001), ("removed", 10002), ("removed", 10003),
+    ]
+
+
+def test_search_index_is_built_lazily_and_kept_current():
+    students = StudentRegistry(_students())
+    assert students._search_index is None
+    assert [student["id"] for student in students.search("alex", limit=2)] == [10001, 10003]
+
+    students.append(create_student("Alexandra Latecomer", 10, 10020))
+    assert 10020 in [student["id"] for student in students.search("Alexandr Latecomr")]
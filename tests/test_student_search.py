@@ -0,0 +1,72 @@
+from student_search import NameSearchIndex
+from vocabulary import Vocabulary
+
+
+def _student(student_id, name):
+    return {"id": student_id, "name": name}
+
+
+def _index():
+    return NameSearchIndex([
+        _student(1, "Alex Procrastinator"),
+        _student(2, "Alexis Overachiever"),
+        _student(3, "Jordan Napper"),
+        _student(4, "Jordan Snackington"),
+        _student(5, "Taylor Procrastinator"),
+    ])
+
+
+def _ids(students):
+    return [student["id"] for student in students]
+
+
+def test_prefix_matches_full_names_and_single_words():
+    index = _index()
+    assert _ids(index.prefix_matches("alex")) == [1, 2]
+    assert _ids(index.prefix_matches("proc")) == [1, 5]
+    assert _ids(index.prefix_matches("JORDAN   nap")) == [3]
+    assert index.prefix_matches("zzz") == []
+    assert index.prefix_matches("   ") == []
+
+
+def test_fuzzy_matches_survive_typos():
+    index = _index()
+    (best, score), *_rest = index.fuzzy_matches("Jordon Snakington")
+    assert best["id"] == 4
+    assert 0 < score <= 1
+    assert index.fuzzy_matches("qqqq") == []
+
+
+def test_search_puts_exact_matches_first_and_never_repeats():
+    index = _index()
+    index.add(_student(6, "Alex"))
+    results = _ids(index.search("alex", limit=5))
+    assert results[0] == 6
+    assert sorted(results[:3]) == [1, 2, 6]
+    assert len(results) == len(set(results))
+
+
+def test_students_added_later_are_searchable_right_away():
+    index = _index()
+    index.add(_student(7, "Jordan Procrastinator"))
+    index.add(_student(8, "Jordan Procrastinator"))  # Same name, same trie key
+    assert _ids(index.prefix_matches("jordan procrastinator")) == [7, 8]
+    assert _ids(index.search("Jordn Procrastinatr", limit=2)) == [7, 8]
+    assert len(index) == 7
+
+
+def test_similar_words_are_capped():
+    index = NameSearchIndex([_student(number, f"Student Smith{number:02d}") for number in range(60)])
+    assert len(index._similar_words("smith", 0.1, 5)) == 5
+    assert len(index.fuzzy_matches("Smith", limit=100, max_words=5)) == 5
+
+
+def test_name_words_are_stored_as_ids_in_a_shared_vocabulary():
+    vocabulary = Vocabulary(["#homework"])
+    index = NameSearchIndex([_student(1, "Alex Procrastinator")], vocabulary=vocabulary)
+    other = NameSearchIndex([_student(2, "Taylor Procrastinator")], vocabulary=vocabulary)
+
+    assert vocabulary.words == ["#homework", "alex", "procrastinator", "taylor"]
+    assert index._student_words == [(1, 2)]
+    assert other._student_words == [(3, 2)]
+    assert _ids(other.search("Taylr Procrastinatr")) == [2]
@@ -0,0 +1,50 @@
+import datetime
+
+from social_feed import SocialFeed
+from social_media import get_trending_hashtags
+from trending import WindowedHashtagCounter, TRENDING_WINDOWS
+
+
+def _post(when, *hashtags):
+    return {
+        "student": "Alex P. Procrastinator",
+        "content": "Procrastination level: expert 🏆⏰",
+        "timestamp": when.isoformat(),
+        "likes": 10,
+        "comments": 0,
+        "hashtags": list(hashtags)
+    }
+
+
+def test_old_buckets_expire_against_the_wall_clock():
+    burst = datetime.datetime(2024, 9, 2, 8, 0)
+    counter = WindowedHashtagCounter(*TRENDING_WINDOWS["hour"], posts=[
+        _post(burst, "#homework", "#mood"),
+        _post(burst + datetime.timedelta(minutes=5), "#homework")
+    ])
+
+    assert counter.top(now=burst + datetime.timedelta(minutes=30)) == [("#homework", 2), ("#mood", 1)]
+    assert counter.top(now=burst + datetime.timedelta(hours=2)) == []
+    assert counter.counts == {}
+
+
+def test_trending_window_ends_now_by_default():
+    now = datetime.datetime.now()
+    feed = SocialFeed([
+        _post(now - datetime.timedelta(days=8), "#cafeteriafood"),
+        _post(now - datetime.timedelta(hours=3), "#coffee")
+    ])
+
+    assert get_trending_hashtags(feed, window="hour") == []
+    assert get_trending_hashtags(feed, window="day") == [("#coffee", 1)]
+    assert get_trending_hashtags(feed) == [("#cafeteriafood", 1), ("#coffee", 1)]
+
+
+def test_plain_list_and_feed_agree_on_windows():
+    now = datetime.datetime.now()
+    posts = [_post(now - datetime.timedelta(minutes=minutes), "#mood", "#vibes" if minutes % 2 else "#real")
+             for minutes in range(0, 180, 7)]
+
+    for window in TRENDING_WINDOWS:
+        assert get_trending_hashtags(posts, window=window, now=now) == \
+            get_trending_hashtags(SocialFeed(posts), window=window, now=now)
@@ -0,0 +1,65 @@
+import pytest
+
+import grade_calculator
+from grade_calculator import (
+    GRADE_WEIGHTS, WEIGHT_PROFILES, calculate_gpa, delete_weight_profile,
+    profile_gpa, record_grade, set_weight_profile,
+)
+from student_utils import create_student
+
+
+@pytest.fixture(autouse=True)
+def restore_standard_weights():
+    saved = dict(GRADE_WEIGHTS)
+    yield
+    GRADE_WEIGHTS.clear()
+    GRADE_WEIGHTS.update(saved)
+    for name in [name for name in WEIGHT_PROFILES if name != "standard"]:
+        delete_weight_profile(name)
+    grade_calculator.clear_gpa_cache()
+
+
+def _student():
+    student = create_student("Alex Procrastinator", 11, 2001)
+    record_grade(student, "tests", 60)
+    record_grade(student, "homework", 100)
+    return student
+
+
+def test_setting_standard_to_its_own_weights_keeps_them():
+    before = dict(GRADE_WEIGHTS)
+    version = WEIGHT_PROFILES["standard"]["version"]
+
+    assert set_weight_profile("standard", WEIGHT_PROFILES["standard"]["weights"]) == version + 1
+    assert GRADE_WEIGHTS == before
+
+
+def test_profile_changes_invalidate_only_that_profile():
+    student = _student()
+    set_weight_profile("tests_only", {"tests": 1.0})
+
+    assert profile_gpa(student, "tests_only") == 60
+    standard = profile_gpa(student)
+    set_weight_profile("tests_only", {"homework": 1.0})
+
+    assert profile_gpa(student, "tests_only") == 100
+    assert profile_gpa(student) == standard == calculate_gpa(student)
+
+
+@pytest.mark.parametrize("weights", [
+    {},
+    {"tests": 0.5, "labs": 0.5},
+    {"tests": 0},
+    {"tests": -0.2},
+    {"tests": float("nan")},
+    {"tests": float("inf")},
+    {"tests": "lots"},
+])
+def test_bad_weights_are_rejected(weights):
+    before = dict(GRADE_WEIGHTS)
+    with pytest.raises(ValueError):
+        set_weight_profile("standard", weights)
+    with pytest.raises(ValueError):
+        set_weight_profile("honors", weights)
+    assert GRADE_WEIGHTS == before
+    assert "honors" not in WEIGHT_PROFILES